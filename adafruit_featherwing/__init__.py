@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_featherwing`
+====================================================
+
+Importing the package loads nothing else. Each FeatherWing class can be imported
+straight from it, and only the module for that class, along with its drivers, is
+loaded on first use.
+
+.. code-block:: python
+
+    from adafruit_featherwing import JoyFeatherWing
+
+    wing = JoyFeatherWing()
+
+Importing the modules themselves, such as
+``from adafruit_featherwing import joy_featherwing``, works as before.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FeatherWing.git"
+
+# The module each class is in
+_MODULES = {
+    "AlphaNumFeatherWing": "alphanum_featherwing",
+    "DotStarFeatherWing": "dotstar_featherwing",
+    "GPSFeatherWing": "gps_featherwing",
+    "INA219FeatherWing": "ina219_featherwing",
+    "JoyFeatherWing": "joy_featherwing",
+    "KeyboardFeatherwing": "keyboard_featherwing",
+    "MatrixFeatherWing": "matrix_featherwing",
+    "MiniTFTFeatherWing": "minitft_featherwing",
+    "NeoPixelFeatherWing": "neopixel_featherwing",
+    "RTCFeatherWing": "rtc_featherwing",
+    "SevenSegmentFeatherWing": "sevensegment_featherwing",
+    "TempMotionFeatherWing": "tempmotion_featherwing",
+    "TFTFeatherWing24": "tft_featherwing_24",
+    "TFTFeatherWing24V2": "tft_featherwing_24",
+    "TFTFeatherWing35": "tft_featherwing_35",
+    "TFTFeatherWing35V2": "tft_featherwing_35",
+}
+
+
+def __getattr__(name: str):
+    module_name = _MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'adafruit_featherwing' has no attribute '{name}'")
+    module = __import__("adafruit_featherwing." + module_name, None, None, (name,))
+    value = getattr(module, name)
+    # Later lookups find the class without coming back here
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODULES))
@@ -0,0 +1,285 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_featherwing.async_tasks`
+====================================================
+
+asyncio front-ends for the FeatherWing helpers. Each wrapper has awaitable methods
+and a ``run()`` coroutine to start as a task. They wait with ``asyncio.sleep``
+instead of ``time.sleep``, so one program can drive several wings at once.
+
+This example scrolls a marquee while reading the GPS and the joystick.
+
+.. code-block:: python
+
+    import asyncio
+    from adafruit_featherwing import alphanum_featherwing, gps_featherwing
+    from adafruit_featherwing import joy_featherwing
+    from adafruit_featherwing.async_tasks import AsyncGPS, AsyncJoy, AsyncSegments
+
+    gps = AsyncGPS(gps_featherwing.GPSFeatherWing(streaming=True))
+    joy = AsyncJoy(joy_featherwing.JoyFeatherWing())
+    display = AsyncSegments(alphanum_featherwing.AlphaNumFeatherWing())
+
+    async def main():
+        await asyncio.gather(
+            asyncio.create_task(gps.run(lambda wing: print(wing.latitude, wing.longitude))),
+            asyncio.create_task(joy.run(print)),
+            asyncio.create_task(display.marquee("Hello from asyncio ")),
+        )
+
+    asyncio.run(main())
+
+* Author(s): Adafruit Industries
+
+Requires:
+* asyncio, which is ``adafruit_asyncio`` on CircuitPython
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FeatherWing.git"
+
+import asyncio
+import time
+
+from adafruit_featherwing.led_segments import Marquee, Segments
+
+try:
+    from typing import Callable, Optional
+
+    from adafruit_featherwing.gps_featherwing import GPSFeatherWing
+    from adafruit_featherwing.ina219_featherwing import PowerSampler
+    from adafruit_featherwing.joy_featherwing import JoyFeatherWing, JoyState
+    from adafruit_featherwing.rtc_featherwing import DateTime, RTCFeatherWing
+except ImportError:
+    pass
+
+
+class AsyncGPS:
+    """Reads a `GPSFeatherWing` from a task. The wing must be created with
+    ``streaming=True`` so that updates never wait on the UART.
+
+    :param GPSFeatherWing gps: The GPS FeatherWing to read
+    :param float interval: (Optional) The seconds between reads of the UART. Keep this
+                           short enough that the ring buffer does not fill (default=0.1)
+    """
+
+    def __init__(self, gps: GPSFeatherWing, interval: float = 0.1):
+        if not gps.streaming:
+            raise ValueError("The GPS FeatherWing must be created with streaming=True")
+        self.gps = gps
+        """The GPS FeatherWing"""
+        self.interval = interval
+        """The seconds between reads of the UART"""
+
+    async def update(self) -> bool:
+        """Parse whatever has been received, then let other tasks run
+
+        :return: Whether new data was parsed
+        :rtype: bool
+        """
+        parsed = self.gps.update()
+        await asyncio.sleep(0)
+        return parsed
+
+    async def wait_for_fix(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the GPS has a fix
+
+        :param float timeout: (Optional) The most seconds to wait. Waits forever if None.
+        :return: Whether there is a fix
+        :rtype: bool
+        """
+        start = time.monotonic()
+        while True:
+            self.gps.update()
+            if self.gps.has_fix:
+                return True
+            if timeout is not None and time.monotonic() - start >= timeout:
+                return False
+            await asyncio.sleep(self.interval)
+
+    async def run(self, callback: Optional[Callable[[GPSFeatherWing], None]] = None):
+        """Keep the GPS data up to date, calling ``callback`` with the wing each time
+        new data is parsed
+
+        :param callback: (Optional) The function to call with new data
+        """
+        while True:
+            if self.gps.update() and callback is not None:
+                callback(self.gps)
+            await asyncio.sleep(self.interval)
+
+
+class AsyncSegments:
+    """Scrolls text on an `AlphaNumFeatherWing` or `SevenSegmentFeatherWing` from a task
+
+    :param Segments display: The segment display FeatherWing
+    """
+
+    def __init__(self, display: Segments):
+        self.display = display
+        """The segment display FeatherWing"""
+
+    async def marquee(self, text: str, delay: float = 0.25, loop: bool = True):
+        """Scroll the text, waiting between characters without blocking other tasks
+
+        :param str text: The text to display
+        :param float delay: (optional) The delay in seconds to pause before scrolling
+                            to the next character (default=0.25)
+        :param bool loop: (optional) Whether to endlessly loop the text (default=True)
+        """
+        marquee = Marquee(self.display, text, delay, loop)
+        while True:
+            marquee.tick()
+            if marquee.done:
+                return
+            await asyncio.sleep(max(0.0, marquee.next_time - time.monotonic()))
+
+
+class AsyncJoy:
+    """Polls a `JoyFeatherWing` from a task
+
+    :param JoyFeatherWing joy: The Joy FeatherWing to poll
+    :param float interval: (Optional) The seconds between polls (default=0.02)
+    :param int threshold: (Optional) How far a joystick axis must move from the last
+                          reported state to count as a change (default=4)
+    """
+
+    def __init__(self, joy: JoyFeatherWing, interval: float = 0.02, threshold: int = 4):
+        self.joy = joy
+        """The Joy FeatherWing"""
+        self.interval = interval
+        """The seconds between polls"""
+        self.threshold = threshold
+        """How far an axis must move to count as a change"""
+        self.state = None
+        """The last state reported as a change, or None before the first poll"""
+
+    def _changed(self, state: JoyState) -> bool:
+        last = self.state
+        return (
+            last is None
+            or state.buttons != last.buttons
+            or abs(state.x - last.x) > self.threshold
+            or abs(state.y - last.y) > self.threshold
+        )
+
+    async def poll(self) -> Optional[JoyState]:
+        """Read the controls once, then let other tasks run
+
+        :return: The new state if it changed, otherwise None
+        """
+        state = self.joy.read_state()
+        await asyncio.sleep(0)
+        if not self._changed(state):
+            return None
+        self.state = state
+        return state
+
+    async def wait_for_press(self, buttons: int) -> int:
+        """Wait until at least one of the buttons is pressed
+
+        :param int buttons: The ``BUTTON_*`` values to wait for, or'd together
+        :return: The buttons in ``buttons`` that are pressed
+        :rtype: int
+        """
+        while True:
+            pressed = self.joy.read_state().buttons & buttons
+            if pressed:
+                return pressed
+            await asyncio.sleep(self.interval)
+
+    async def run(self, callback: Callable[[JoyState], None]):
+        """Poll the controls, calling ``callback`` with the `JoyState` when it changes
+
+        :param callback: The function to call with each new state
+        """
+        while True:
+            state = await self.poll()
+            if state is not None:
+                callback(state)
+            await asyncio.sleep(self.interval)
+
+
+class AsyncPowerSampler:
+    """Feeds a `PowerSampler` from a task, one sample per
+    `PowerSampler.sample_interval`
+
+    :param PowerSampler sampler: The sampler to feed
+    """
+
+    def __init__(self, sampler: PowerSampler):
+        self.sampler = sampler
+        """The power sampler"""
+
+    async def sample(self):
+        """Wait for a new conversion, then take a sample
+
+        :return: The load voltage in volts, the current in mA and the power in mW
+        :rtype: tuple
+        """
+        await asyncio.sleep(self.sampler.sample_interval)
+        return self.sampler.sample()
+
+    async def run(self, callback: Optional[Callable[[PowerSampler], None]] = None):
+        """Keep sampling, calling ``callback`` with the sampler after each sample
+
+        :param callback: (Optional) The function to call after each sample
+        """
+        while True:
+            self.sampler.sample()
+            if callback is not None:
+                callback(self.sampler)
+            await asyncio.sleep(self.sampler.sample_interval)
+
+
+class AsyncRTC:
+    """Ticks once a second from an `RTCFeatherWing` in a task. Setting
+    `RTCFeatherWing.cache_interval` keeps the polling off the I2C bus.
+
+    :param RTCFeatherWing rtc: The RTC FeatherWing to read
+    :param float resolution: (Optional) How often to check for the next second once
+                             it is nearly due, which is also how late a tick can be
+                             (default=0.02)
+    """
+
+    def __init__(self, rtc: RTCFeatherWing, resolution: float = 0.02):
+        self.rtc = rtc
+        """The RTC FeatherWing"""
+        self.resolution = resolution
+        """How often to check for the next second once it is nearly due"""
+        self._tick_time = None
+        self._second = None
+
+    async def tick(self) -> DateTime:
+        """Wait for the next second after the last one returned to start. If that has
+        already happened, such as after a callback that took longer than a second, the
+        current time is returned straight away.
+
+        :return: The date and time at the start of the second
+        """
+        previous = self._second
+        if previous is None:
+            previous = self.rtc.now.second
+        elif self._tick_time is not None:
+            # Sleep through most of the second before polling for the change
+            wait = self._tick_time + 1 - self.resolution - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+        while True:
+            now = self.rtc.now
+            if now.second != previous:
+                self._second = now.second
+                self._tick_time = time.monotonic()
+                return now
+            await asyncio.sleep(self.resolution)
+
+    async def run(self, callback: Callable[[DateTime], None]):
+        """Call ``callback`` with the date and time at the start of every second
+
+        :param callback: The function to call each second
+        """
+        while True:
+            callback(await self.tick())
@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_featherwing.event_queue`
+====================================================
+
+Fixed-size event queue for the helpers that report events, such as joy_featherwing
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FeatherWing.git"
+
+try:
+    from typing import Any, Optional
+except ImportError:
+    pass
+
+
+class EventQueue:
+    """A fixed-size ring buffer of events. Nothing is allocated once it is created,
+    and new events are dropped while it is full.
+
+    :param int size: The number of events to hold
+    """
+
+    def __init__(self, size: int):
+        if not isinstance(size, int) or size < 1:
+            raise ValueError("Queue size must be a positive integer")
+        self._events = [None] * size
+        self._start = 0
+        self._count = 0
+        self.dropped = 0
+        """The number of events dropped because the queue was full"""
+
+    def __len__(self) -> int:
+        return self._count
+
+    def put(self, event: Any) -> int:
+        """Add an event to the ring buffer, dropping it if the buffer is full.
+
+        :return: The number of events added, 1 or 0
+        :rtype: int
+        """
+        size = len(self._events)
+        if self._count == size:
+            self.dropped += 1
+            return 0
+        self._events[(self._start + self._count) % size] = event
+        self._count += 1
+        return 1
+
+    def get(self) -> Optional[Any]:
+        """Remove and return the oldest event, or None if the queue is empty"""
+        if not self._count:
+            return None
+        event = self._events[self._start]
+        self._events[self._start] = None
+        self._start = (self._start + 1) % len(self._events)
+        self._count -= 1
+        return event
@@ -14,15 +14,197 @@ Helper for using the `Ultimate GPS FeatherWing <https://www.adafruit.com/product
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FeatherWing.git"
 
+import struct
+import time
+from collections import namedtuple
+
 import adafruit_gps
 import board
 import busio
+from micropython import const
 
 try:
-    from typing import Optional
+    from typing import Iterator, Optional, Sequence
+
+    from busio import UART
 except ImportError:
     pass
 
+# NMEA sentences are at most 82 bytes, leave room for a little more
+_MAX_SENTENCE = const(128)
+_CHUNK_SIZE = const(64)
+
+# The position of each sentence in the PMTK314 output mask and roughly how many
+# bytes it adds to every fix
+_SENTENCES = {
+    "GLL": (0, 50),
+    "RMC": (1, 70),
+    "VTG": (2, 40),
+    "GGA": (3, 75),
+    "GSA": (4, 65),
+    "GSV": (5, 210),
+}
+_MIN_UPDATE_PERIOD = const(100)
+
+# Fix records: UTC year, month, day, hour, minute, second, then latitude and
+# longitude in 1e-7 degrees, altitude in cm, speed in 0.01 knots, track angle
+# in 0.01 degrees and horizontal dilution in 0.01
+_RECORD_FORMAT = "<HBBBBBxiiiHHH"
+_RECORD_SIZE = struct.calcsize(_RECORD_FORMAT)
+_MISSING_INT = const(-0x80000000)
+_MISSING_UINT = const(0xFFFF)
+
+Fix = namedtuple(
+    "Fix",
+    "timestamp latitude longitude altitude speed_knots track_angle horizontal_dilution",
+)
+
+
+class NMEARingBuffer:
+    """Non-blocking reader that drains a UART into a fixed-size ring buffer and
+    hands complete NMEA sentences to the GPS parser.
+
+    It looks like a UART to ``adafruit_gps``, but ``readline()`` only returns
+    complete sentences, as a view of a reused line buffer.
+
+    :param UART uart: The UART the GPS module is connected to, opened with a timeout of 0
+    :param int size: (Optional) The size of the ring buffer in bytes (default=1024)
+    """
+
+    def __init__(self, uart: UART, size: int = 1024):
+        if size < _MAX_SENTENCE:
+            raise ValueError(f"The buffer size must be at least {_MAX_SENTENCE} bytes")
+        self._uart = uart
+        self._buffer = bytearray(size)
+        self._start = 0
+        self._count = 0
+        self._lines = 0
+        self._chunk = bytearray(_CHUNK_SIZE)
+        self._chunk_view = memoryview(self._chunk)
+        self._line = bytearray(_MAX_SENTENCE)
+        self._line_view = memoryview(self._line)
+        self.dropped = 0
+        """The number of sentences dropped because the buffer overflowed"""
+
+    @property
+    def lines(self):
+        """The number of complete sentences waiting in the buffer"""
+        return self._lines
+
+    @property
+    def in_waiting(self):
+        """The number of bytes waiting, counted only once a sentence is complete"""
+        return self._count if self._lines else 0
+
+    def drain(self) -> int:
+        """
+        Move everything the UART has received into the ring buffer without blocking
+
+        :return: The number of bytes moved
+        :rtype: int
+        """
+        total = 0
+        waiting = self._uart.in_waiting
+        while waiting:
+            size = self._uart.readinto(self._chunk_view[: min(waiting, _CHUNK_SIZE)])
+            if not size:
+                break
+            self._store(size)
+            total += size
+            waiting = self._uart.in_waiting
+        return total
+
+    def _store(self, size: int):
+        """
+        Copy the start of the chunk into the ring buffer, dropping the oldest
+        sentences to make room if needed
+        """
+        length = len(self._buffer)
+        while length - self._count < size:
+            if not self._lines:
+                # One sentence filled the buffer without ending, so it is garbage
+                self._start = 0
+                self._count = 0
+                self.dropped += 1
+                break
+            self._discard(self._find_newline() + 1)
+            self.dropped += 1
+        end = (self._start + self._count) % length
+        first = min(size, length - end)
+        self._buffer[end : end + first] = self._chunk_view[:first]
+        if first < size:
+            self._buffer[0 : size - first] = self._chunk_view[first:size]
+        self._count += size
+        self._lines += self._chunk.count(b"\n", 0, size)
+
+    def _find_newline(self) -> int:
+        """
+        Return how far the first newline is past the start of the buffer, or -1
+        """
+        length = len(self._buffer)
+        end = self._start + self._count
+        index = self._buffer.find(b"\n", self._start, min(end, length))
+        if index >= 0:
+            return index - self._start
+        if end > length:
+            index = self._buffer.find(b"\n", 0, end - length)
+            if index >= 0:
+                return index + length - self._start
+        return -1
+
+    def _discard(self, size: int):
+        """
+        Drop bytes from the start of the ring buffer
+        """
+        self._start = (self._start + size) % len(self._buffer)
+        self._count -= size
+        self._lines -= 1
+
+    def readline(self) -> Optional[memoryview]:
+        """
+        Remove the oldest complete sentence from the ring buffer
+
+        :return: The sentence including the newline, valid until the next call,
+                 or None if there is no complete sentence
+        """
+        if not self._lines:
+            return None
+        size = self._find_newline() + 1
+        if size > _MAX_SENTENCE:
+            self._discard(size)
+            self.dropped += 1
+            return None
+        length = len(self._buffer)
+        first = min(size, length - self._start)
+        self._line[0:first] = self._buffer[self._start : self._start + first]
+        if first < size:
+            self._line[first:size] = self._buffer[0 : size - first]
+        self._discard(size)
+        return self._line_view[:size]
+
+    def read(self, size: int) -> Optional[bytearray]:
+        """
+        Remove up to size bytes from the ring buffer, complete sentence or not
+        """
+        size = min(size, self._count)
+        if not size:
+            return None
+        length = len(self._buffer)
+        first = min(size, length - self._start)
+        data = self._buffer[self._start : self._start + first]
+        if first < size:
+            data += self._buffer[0 : size - first]
+        self._start = (self._start + size) % length
+        self._count -= size
+        self._lines -= data.count(b"\n")
+        return data
+
+    def write(self, data: bytes) -> Optional[int]:
+        """
+        Write data to the UART
+        """
+        return self._uart.write(data)
+
 
 class GPSFeatherWing:
     """Class representing an `Ultimate GPS FeatherWing
@@ -30,34 +212,162 @@ class GPSFeatherWing:
 
     Automatically uses the feather's UART bus."""
 
-    def __init__(self, update_period: int = 1000, baudrate: int = 9600):
+    def __init__(
+        self,
+        update_period: int = 1000,
+        baudrate: int = 9600,
+        streaming: bool = False,
+        buffer_size: int = 1024,
+        target_baudrate: Optional[int] = None,
+        sentences: Sequence[str] = ("GGA", "RMC"),
+    ):
         """
         :param int update_period: (Optional) The amount of time in milliseconds between
                                   updates (default=1000)
         :param int baudrate: (Optional) The Serial Connection speed to the GPS (default=9600)
+        :param bool streaming: (Optional) Read the UART without blocking into a ring buffer
+                               and parse every complete sentence on each update (default=False)
+        :param int buffer_size: (Optional) The size of the streaming ring buffer in bytes
+                                (default=1024)
+        :param int target_baudrate: (Optional) A faster Serial Connection speed to switch
+                                    the GPS to after connecting at baudrate. Raises
+                                    RuntimeError if the GPS does not answer at it
+                                    (default=None)
+        :param sentences: (Optional) The NMEA sentences the GPS should send, any of
+                          GLL, RMC, VTG, GGA, GSA and GSV (default=("GGA", "RMC"))
+        :type sentences: list/tuple of str
+
+        The update period is lengthened if the Serial Connection is too slow to carry
+        the selected sentences that often. Check ``update_period`` for the value used.
         """
         if not isinstance(update_period, int):
             raise ValueError("Update Frequency should be an integer in milliseconds")
-        if update_period < 250:
-            raise ValueError("Update Frequency be at least 250 milliseconds")
+        if update_period < _MIN_UPDATE_PERIOD:
+            raise ValueError(f"Update Frequency be at least {_MIN_UPDATE_PERIOD} milliseconds")
+        mask = [0] * 19
+        fix_size = 0
+        for sentence in sentences:
+            if sentence not in _SENTENCES:
+                raise ValueError(f"Unknown NMEA sentence {sentence}")
+            position, size = _SENTENCES[sentence]
+            mask[position] = 1
+            fix_size += size
+        self._mask_command = bytes("PMTK314," + ",".join(str(bit) for bit in mask), "utf-8")
         timeout = update_period // 1000 + 2
         timeout = max(timeout, 3)
 
-        self._uart = busio.UART(board.TX, board.RX, baudrate=baudrate, timeout=timeout)
-        self._gps = adafruit_gps.GPS(self._uart, debug=False)
-        # Turn on the basic GGA and RMC info
-        self._gps.send_command(bytes("PMTK314,0,1,0,1,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0", "utf-8"))
-        self._gps.send_command(bytes(f"PMTK220,{update_period}", "utf-8"))
+        self._stream = None
+        if streaming:
+            self._uart = busio.UART(board.TX, board.RX, baudrate=baudrate, timeout=0)
+            self._stream = NMEARingBuffer(self._uart, buffer_size)
+            self._gps = adafruit_gps.GPS(self._stream, debug=False)
+        else:
+            self._uart = busio.UART(board.TX, board.RX, baudrate=baudrate, timeout=timeout)
+            self._gps = adafruit_gps.GPS(self._uart, debug=False)
+        self._baudrate = baudrate
+        # Turn on only the sentences that were asked for. This is also how a
+        # baudrate change is checked, so it only has to be sent if that failed.
+        try:
+            changed = target_baudrate is not None and self._change_baudrate(target_baudrate)
+        except RuntimeError:
+            # Free the pins so the wing can be created again
+            self._uart.deinit()
+            raise
+        if not changed:
+            self._gps.send_command(self._mask_command)
+
+        # Each byte takes 10 bits on the wire
+        link_period = fix_size * 10 * 1000 // self._baudrate + 1
+        self._update_period = max(update_period, link_period)
+        self._gps.send_command(bytes(f"PMTK220,{self._update_period}", "utf-8"))
+
+    def _change_baudrate(self, baudrate: int) -> bool:
+        """
+        Switch the GPS and the UART to a new baudrate and check that the GPS still
+        answers, going back to the old baudrate and raising RuntimeError if it does not
+
+        :return: Whether the baudrate was changed, which is False if it was already in use
+        """
+        if baudrate == self._baudrate:
+            return False
+        self._gps.send_command(bytes(f"PMTK251,{baudrate}", "utf-8"))
+        # Let the command finish sending before the UART changes speed
+        time.sleep(0.1)
+        self._uart.baudrate = baudrate
+        self._uart.reset_input_buffer()
+        self._gps.send_command(self._mask_command)
+        if not self._wait_for_ack(b"314"):
+            self._uart.baudrate = self._baudrate
+            self._uart.reset_input_buffer()
+            raise RuntimeError(f"GPS did not acknowledge baudrate {baudrate}")
+        self._baudrate = baudrate
+        self._uart.reset_input_buffer()
+        return True
+
+    def _wait_for_ack(self, command: bytes, timeout: float = 1.0) -> bool:
+        """
+        Wait for the GPS to acknowledge a PMTK command as successful
+        """
+        ack = b"$PMTK001," + command + b",3"
+        received = bytearray()
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            waiting = self._uart.in_waiting
+            if waiting:
+                received += self._uart.read(waiting)
+                if ack in received:
+                    return True
+                # Keep only enough to find an acknowledgement split across reads
+                received = received[-len(ack) :]
+        return False
+
+    @property
+    def update_period(self):
+        """
+        Return the time in milliseconds between updates the GPS was set to
+        """
+        return self._update_period
+
+    @property
+    def baudrate(self):
+        """
+        Return the Serial Connection speed in use
+        """
+        return self._baudrate
 
     def update(self) -> bool:
         """
         Make sure to call ``gps.update()`` every loop iteration and at least twice
         as fast as data comes from the GPS unit (usually every second).
 
+        When streaming, this never waits on the UART. It moves whatever has been
+        received into the ring buffer and parses every complete sentence.
+
         :return: Whether it has parsed new data
         :rtype: bool
         """
-        return self._gps.update()
+        if self._stream is None:
+            return self._gps.update()
+        self._stream.drain()
+        parsed = False
+        for _ in range(self._stream.lines):
+            if self._gps.update():
+                parsed = True
+        return parsed
+
+    @property
+    def streaming(self):
+        """
+        Return whether the UART is read without blocking into a ring buffer
+        """
+        return self._stream is not None
+
+    @property
+    def dropped_sentences(self):
+        """
+        Return the number of sentences dropped because the streaming buffer overflowed
+        """
+        return self._stream.dropped if self._stream is not None else 0
 
     def read(self, size: int) -> Optional[bytearray]:
         """
@@ -68,6 +378,9 @@ class GPSFeatherWing:
         :rtype: bytearray
         """
         if isinstance(size, int) and size > 0:
+            if self._stream is not None:
+                self._stream.drain()
+                return self._stream.read(size)
             return self._uart.read(size)
         return None
 
@@ -170,3 +483,152 @@ class GPSFeatherWing:
         Return the Height GeoID in  meters
         """
         return self._gps.height_geoid
+
+
+def _pack_int(value: Optional[float], scale: int) -> int:
+    """Scale a signed value for a fix record"""
+    return _MISSING_INT if value is None else round(value * scale)
+
+
+def _pack_uint(value: Optional[float]) -> int:
+    """Scale an unsigned value to hundredths for a fix record"""
+    return _MISSING_UINT if value is None else min(round(value * 100), _MISSING_UINT - 1)
+
+
+def _unpack_int(value: int, scale: int) -> Optional[float]:
+    """Undo _pack_int"""
+    return None if value == _MISSING_INT else value / scale
+
+
+def _unpack_uint(value: int) -> Optional[float]:
+    """Undo _pack_uint"""
+    return None if value == _MISSING_UINT else value / 100
+
+
+class FixRecorder:
+    """Log GPS fixes to a file as fixed-size binary records.
+
+    Records are packed into a page buffer in memory and the file is only written
+    once a page is full, or when `flush` or `close` is called. Read the file back
+    with `read_fixes`.
+
+    The GPS sends more than one sentence for each fix, such as GGA and RMC, and
+    `GPSFeatherWing.update` returns True for each of them. A fix with the same
+    timestamp as the last one recorded is skipped, so each fix is logged once.
+
+    :param str path: The file to append the records to, such as ``/sd/fixes.bin``
+    :param int page_size: (Optional) The size in bytes of the buffer that is written
+                          to the file in one go (default=512)
+
+    This example logs every fix to the SD card of a TFT FeatherWing.
+
+    .. code-block:: python
+
+        from adafruit_featherwing import gps_featherwing, tft_featherwing_24
+
+        gps = gps_featherwing.GPSFeatherWing()
+        tft = tft_featherwing_24.TFTFeatherWing24()
+        tft.mount_sd()
+
+        with gps_featherwing.FixRecorder("/sd/fixes.bin") as recorder:
+            while True:
+                # Called for every sentence, but each fix is only recorded once
+                if gps.update():
+                    recorder.record(gps)
+
+    """
+
+    def __init__(self, path: str, page_size: int = 512):
+        if page_size < _RECORD_SIZE:
+            raise ValueError(f"The page size must be at least {_RECORD_SIZE} bytes")
+        self._file = open(path, "ab")
+        self._page = bytearray(page_size // _RECORD_SIZE * _RECORD_SIZE)
+        self._page_view = memoryview(self._page)
+        self._offset = 0
+        self._last_time = None
+
+    def record(self, gps: GPSFeatherWing) -> bool:
+        """
+        Add the current fix to the page buffer, writing the page out when it is full.
+        Nothing is added if the fix has the same timestamp as the last one recorded.
+
+        :param GPSFeatherWing gps: The GPS to read the fix from
+        :return: Whether a new fix was recorded
+        :rtype: bool
+        """
+        timestamp = gps.timestamp
+        if not gps.has_fix or timestamp is None:
+            return False
+        fix_time = tuple(timestamp[:6])
+        if fix_time == self._last_time:
+            return False
+        self._last_time = fix_time
+        struct.pack_into(
+            _RECORD_FORMAT,
+            self._page,
+            self._offset,
+            timestamp.tm_year,
+            timestamp.tm_mon,
+            timestamp.tm_mday,
+            timestamp.tm_hour,
+            timestamp.tm_min,
+            timestamp.tm_sec,
+            _pack_int(gps.latitude, 10000000),
+            _pack_int(gps.longitude, 10000000),
+            _pack_int(gps.altitude, 100),
+            _pack_uint(gps.speed_knots),
+            _pack_uint(gps.track_angle),
+            _pack_uint(gps.horizontal_dilution),
+        )
+        self._offset += _RECORD_SIZE
+        if self._offset == len(self._page):
+            self.flush()
+        return True
+
+    def flush(self):
+        """
+        Write any buffered records to the file
+        """
+        if self._offset:
+            self._file.write(self._page_view[: self._offset])
+            self._file.flush()
+            self._offset = 0
+
+    def close(self):
+        """
+        Write any buffered records and close the file
+        """
+        self.flush()
+        self._file.close()
+
+    def __enter__(self) -> "FixRecorder":
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+
+def read_fixes(path: str, page_size: int = 512) -> Iterator[Fix]:
+    """
+    Stream the fixes back from a file written by `FixRecorder`, a page at a time
+
+    :param str path: The file to read
+    :param int page_size: (Optional) The size in bytes of each read (default=512)
+    """
+    page = bytearray(max(page_size // _RECORD_SIZE, 1) * _RECORD_SIZE)
+    with open(path, "rb") as file:
+        while True:
+            size = file.readinto(page)
+            if not size:
+                return
+            for offset in range(0, size - _RECORD_SIZE + 1, _RECORD_SIZE):
+                record = struct.unpack_from(_RECORD_FORMAT, page, offset)
+                yield Fix(
+                    time.struct_time(record[:6] + (-1, -1, -1)),
+                    _unpack_int(record[6], 10000000),
+                    _unpack_int(record[7], 10000000),
+                    _unpack_int(record[8], 100),
+                    _unpack_uint(record[9]),
+                    _unpack_uint(record[10]),
+                    _unpack_uint(record[11]),
+                )
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_featherwing.ht16k33_ram`
+====================================================
+
+Display RAM writer shared by the helpers matrix_featherwing and led_segments
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FeatherWing.git"
+
+from adafruit_bus_device import i2c_device
+
+try:
+    from busio import I2C
+    from circuitpython_typing import ReadableBuffer
+except ImportError:
+    pass
+
+
+class HT16K33RAM:
+    """Keeps track of what is in the 16 bytes of HT16K33 display RAM, so only the span
+    that changed is sent, in a single I2C write.
+
+    :param I2C i2c: The I2C bus the HT16K33 is on
+    :param int address: The I2C address of the HT16K33
+    """
+
+    def __init__(self, i2c: I2C, address: int):
+        self.i2c_device = i2c_device.I2CDevice(i2c, address, probe=False)
+        # What was last sent. The driver clears the display on startup.
+        self._shown = bytearray(16)
+        # Byte 0 is the display RAM address to start writing at
+        self._write_buffer = bytearray(17)
+
+    def write(self, buffer: ReadableBuffer, offset: int = 0):
+        """Send the bytes that differ from what was last sent, and nothing if none do
+
+        :param buffer: The buffer holding the 16 bytes of display RAM
+        :param int offset: (Optional) Where the display RAM starts in the buffer (default=0)
+        """
+        shown = self._shown
+        first = 0
+        while first < 16 and buffer[offset + first] == shown[first]:
+            first += 1
+        if first == 16:
+            return
+        last = 15
+        while buffer[offset + last] == shown[last]:
+            last -= 1
+        length = last - first + 1
+        self._write_buffer[0] = first
+        self._write_buffer[1 : length + 1] = buffer[offset + first : offset + last + 1]
+        with self.i2c_device:
+            self.i2c_device.write(self._write_buffer, end=length + 1)
+        shown[first : last + 1] = buffer[offset + first : offset + last + 1]
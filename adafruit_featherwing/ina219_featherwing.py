@@ -17,27 +17,119 @@ Helper for using the `INA219 FeatherWing <https://www.adafruit.com/product/3650>
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FeatherWing.git"
 
+import struct
+import time
+from array import array
+from collections import namedtuple
+
 import adafruit_ina219
 import board
+from adafruit_ina219 import ADCResolution
+from micropython import const
 
 try:
-    from typing import Optional
+    from typing import Iterator, Optional, Tuple
 
     from busio import I2C
 except ImportError:
     pass
 
+_REG_SHUNTVOLTAGE = const(0x01)
+_REG_BUSVOLTAGE = const(0x02)
+# The FeatherWing has a 0.1 ohm shunt resistor
+_SHUNT_OHMS = 0.1
+
+# Conversion time in microseconds for each ADCResolution setting
+_CONVERSION_US = {
+    ADCResolution.ADCRES_9BIT_1S: 84,
+    ADCResolution.ADCRES_10BIT_1S: 148,
+    ADCResolution.ADCRES_11BIT_1S: 276,
+    ADCResolution.ADCRES_12BIT_1S: 532,
+    ADCResolution.ADCRES_12BIT_2S: 1060,
+    ADCResolution.ADCRES_12BIT_4S: 2130,
+    ADCResolution.ADCRES_12BIT_8S: 4260,
+    ADCResolution.ADCRES_12BIT_16S: 8510,
+    ADCResolution.ADCRES_12BIT_32S: 17020,
+    ADCResolution.ADCRES_12BIT_64S: 34050,
+    ADCResolution.ADCRES_12BIT_128S: 68100,
+}
+
+# Profile name: (ADC resolution and averaging, calibration method)
+_PROFILES = {
+    "fast": (ADCResolution.ADCRES_9BIT_1S, "set_calibration_32V_2A"),
+    "balanced": (ADCResolution.ADCRES_12BIT_1S, "set_calibration_32V_2A"),
+    "high_precision": (ADCResolution.ADCRES_12BIT_32S, "set_calibration_16V_400mA"),
+}
+
+Stats = namedtuple("Stats", "minimum maximum mean")
+
 
 class INA219FeatherWing:
     """Class representing an `Adafruit INA219 FeatherWing
     <https://www.adafruit.com/product/3650>`_.
 
-    Automatically uses the feather's I2C bus."""
+    Automatically uses the feather's I2C bus.
+
+    :param I2C i2c: (Optional) The I2C bus to use
+    :param str profile: (Optional) The measurement profile to use (default="balanced")
+    """
 
-    def __init__(self, i2c: Optional[I2C] = None):
+    def __init__(self, i2c: Optional[I2C] = None, profile: str = "balanced"):
         if i2c is None:
             i2c = board.I2C()
         self._ina219 = adafruit_ina219.INA219(i2c)
+        self._register = bytearray(1)
+        self._raw = bytearray(4)
+        # The driver starts out with the same settings as the balanced profile
+        self._profile = "balanced"
+        self._conversion_time = 2 * _CONVERSION_US[ADCResolution.ADCRES_12BIT_1S] / 1000000
+        if profile != self._profile:
+            self.profile = profile
+
+    @property
+    def profile(self) -> str:
+        """The measurement profile, which sets the ADC resolution and averaging for both
+        the bus and shunt voltage and the calibration range. One of:
+
+        * ``"fast"``: 9 bit single samples with the 32V 2A range
+        * ``"balanced"``: 12 bit single samples with the 32V 2A range (the default)
+        * ``"high_precision"``: 12 bit averaged over 32 samples with the 16V 400mA range
+
+        This example switches to the fast profile and prints the resulting sample rate.
+
+        .. code-block:: python
+
+            from adafruit_featherwing import ina219_featherwing
+
+            ina219 = ina219_featherwing.INA219FeatherWing()
+            ina219.profile = "fast"
+            print("Sample rate: {} Hz".format(ina219.sample_rate))
+
+        """
+        return self._profile
+
+    @profile.setter
+    def profile(self, name: str):
+        if name not in _PROFILES:
+            raise ValueError("Profile must be one of: " + ", ".join(_PROFILES))
+        resolution, calibration = _PROFILES[name]
+        # The calibration methods also set the resolution, so they go first
+        getattr(self._ina219, calibration)()
+        self._ina219.bus_adc_resolution = resolution
+        self._ina219.shunt_adc_resolution = resolution
+        self._profile = name
+        self._conversion_time = 2 * _CONVERSION_US[resolution] / 1000000
+
+    @property
+    def conversion_time(self) -> float:
+        """The time in seconds the INA219 takes to convert both the shunt and bus voltage
+        with the current profile, which is how often new readings become available"""
+        return self._conversion_time
+
+    @property
+    def sample_rate(self) -> float:
+        """The maximum number of new readings per second with the current profile"""
+        return 1 / self._conversion_time
 
     @property
     def bus_voltage(self):
@@ -119,3 +211,180 @@ class INA219FeatherWing:
 
         """
         return self._ina219.current
+
+    def read_sample(self) -> Tuple[float, float, float]:
+        """Read the bus voltage and shunt voltage back to back without releasing
+        the I2C bus, and work out the current from the same shunt voltage reading.
+
+        :return: The bus voltage in volts, the shunt voltage in volts and the current in mA
+        :rtype: tuple
+        """
+        register = self._register
+        raw = self._raw
+        with self._ina219.i2c_device as i2c:
+            register[0] = _REG_SHUNTVOLTAGE
+            i2c.write_then_readinto(register, raw, in_end=2)
+            register[0] = _REG_BUSVOLTAGE
+            i2c.write_then_readinto(register, raw, in_start=2)
+        shunt, bus = struct.unpack(">hH", raw)
+        # Shunt voltage is 10uV per bit, bus voltage is 4mV per bit above 3 status bits
+        shunt_voltage = shunt * 0.00001
+        return (bus >> 3) * 0.004, shunt_voltage, shunt_voltage / _SHUNT_OHMS * 1000
+
+
+class PowerSampler:
+    """Sample an `INA219FeatherWing` into a ring buffer and keep running statistics
+    and the charge and energy used.
+
+    :param INA219FeatherWing wing: The INA219 FeatherWing to sample
+    :param int size: (Optional) The number of samples to keep (default=256)
+    :param float interval: (Optional) The minimum time in seconds between samples
+                           taken by `poll`. Defaults to the wing's
+                           `INA219FeatherWing.conversion_time`, so each sample is a
+                           new reading.
+
+    This example measures the energy used by a load.
+
+    .. code-block:: python
+
+        from adafruit_featherwing import ina219_featherwing
+
+        ina219 = ina219_featherwing.INA219FeatherWing()
+        sampler = ina219_featherwing.PowerSampler(ina219)
+
+        while True:
+            sampler.poll()
+            print(sampler.charge, "mAh", sampler.energy, "mWh")
+
+    """
+
+    def __init__(
+        self,
+        wing: INA219FeatherWing,
+        size: int = 256,
+        interval: Optional[float] = None,
+    ):
+        self._wing = wing
+        self.interval = interval
+        """The minimum time in seconds between samples taken by `poll`, or ``None``
+        to follow the wing's profile"""
+        self._times = array("L", [0] * size)
+        self._voltages = array("f", [0] * size)
+        self._currents = array("f", [0] * size)
+        self.reset()
+
+    def reset(self):
+        """Clear the samples, statistics and totals"""
+        self._start_ns = time.monotonic_ns()
+        self._last_ns = None
+        self._next = 0
+        self._count = 0
+        self._samples = 0
+        self._voltage_stats = [0.0, 0.0, 0.0]
+        self._current_stats = [0.0, 0.0, 0.0]
+        self._power_stats = [0.0, 0.0, 0.0]
+        self._charge = 0.0
+        self._energy = 0.0
+
+    def poll(self) -> bool:
+        """
+        Take a sample if at least `interval` seconds have passed since the last one
+
+        :return: Whether a sample was taken
+        :rtype: bool
+        """
+        if self._last_ns is not None:
+            if time.monotonic_ns() - self._last_ns < self.sample_interval * 1000000000:
+                return False
+        self.sample()
+        return True
+
+    @property
+    def sample_interval(self):
+        """The time in seconds `poll` waits between samples, which is `interval` or
+        the wing's `INA219FeatherWing.conversion_time` when that is ``None``"""
+        if self.interval is None:
+            return self._wing.conversion_time
+        return self.interval
+
+    def sample(self) -> Tuple[float, float, float]:
+        """
+        Take a sample now and add it to the buffer, statistics and totals
+
+        :return: The load voltage in volts, the current in mA and the power in mW
+        :rtype: tuple
+        """
+        bus_voltage, shunt_voltage, current = self._wing.read_sample()
+        now = time.monotonic_ns()
+        voltage = bus_voltage + shunt_voltage
+        power = bus_voltage * current
+
+        if self._last_ns is not None:
+            hours = (now - self._last_ns) / 3600000000000
+            self._charge += current * hours
+            self._energy += power * hours
+        self._last_ns = now
+
+        size = len(self._times)
+        self._times[self._next] = (now - self._start_ns) // 1000000
+        self._voltages[self._next] = voltage
+        self._currents[self._next] = current
+        self._next = (self._next + 1) % size
+        self._count = min(self._count + 1, size)
+
+        self._samples += 1
+        for stats, value in (
+            (self._voltage_stats, voltage),
+            (self._current_stats, current),
+            (self._power_stats, power),
+        ):
+            if self._samples == 1:
+                stats[0] = stats[1] = stats[2] = value
+            else:
+                stats[0] = min(stats[0], value)
+                stats[1] = max(stats[1], value)
+                stats[2] += (value - stats[2]) / self._samples
+        return voltage, current, power
+
+    def samples(self) -> Iterator[Tuple[int, float, float]]:
+        """
+        Iterate over the buffered samples from oldest to newest
+
+        :return: The time in ms since the sampler started, the load voltage in volts
+                 and the current in mA for each sample
+        """
+        size = len(self._times)
+        first = (self._next - self._count) % size
+        for offset in range(self._count):
+            index = (first + offset) % size
+            yield self._times[index], self._voltages[index], self._currents[index]
+
+    @property
+    def count(self):
+        """The number of samples taken since the last reset"""
+        return self._samples
+
+    @property
+    def voltage(self):
+        """The minimum, maximum and mean load voltage in volts"""
+        return Stats(*self._voltage_stats)
+
+    @property
+    def current(self):
+        """The minimum, maximum and mean current in mA"""
+        return Stats(*self._current_stats)
+
+    @property
+    def power(self):
+        """The minimum, maximum and mean power in mW"""
+        return Stats(*self._power_stats)
+
+    @property
+    def charge(self):
+        """The charge used since the last reset in mAh"""
+        return self._charge
+
+    @property
+    def energy(self):
+        """The energy used since the last reset in mWh"""
+        return self._energy
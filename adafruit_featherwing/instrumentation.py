@@ -0,0 +1,373 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_featherwing.instrumentation`
+====================================================
+
+Counts the calls, bus transactions, bytes and time spent in the drivers a FeatherWing
+helper holds, to find which properties and methods are the expensive ones.
+
+`Profiler.instrument` puts a probe in front of each driver (``_seesaw``, ``_rtc``,
+``_matrix``, ``_segments``, ``_ina219``, ``_uart`` and so on) and in front of the I2C
+bus the driver talks through. Nothing is changed until a wing is instrumented, and
+disabling the profiler puts the original drivers and buses back until it is enabled
+again, so a disabled profiler costs nothing.
+
+Only core built-ins are used, so the profiler runs on a board as well as on a
+desktop computer with `adafruit_featherwing.simulation`.
+
+.. code-block:: python
+
+    from adafruit_featherwing import rtc_featherwing
+    from adafruit_featherwing.instrumentation import Profiler
+
+    rtc = rtc_featherwing.RTCFeatherWing()
+    profiler = Profiler()
+    profiler.instrument(rtc)
+
+    for _ in range(10):
+        print(rtc.now)
+
+    profiler.dump()
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FeatherWing.git"
+
+import sys
+import time
+
+try:
+    from typing import Any, Dict, List, Optional
+except ImportError:
+    pass
+
+DRIVER_ATTRIBUTES = (
+    "_seesaw",
+    "_ss",
+    "_rtc",
+    "_matrix",
+    "_segments",
+    "_ina219",
+    "_adxl343",
+    "_adt7410",
+    "_uart",
+)
+"""The attributes `Profiler.instrument` looks for on a wing"""
+
+
+class CallStats:
+    """The totals for one method or property of an instrumented driver"""
+
+    def __init__(self):
+        self.calls = 0
+        """The number of calls or property accesses"""
+        self.transactions = 0
+        """The number of bus transactions made during the calls"""
+        self.bytes_written = 0
+        """The number of bytes written to the bus during the calls"""
+        self.bytes_read = 0
+        """The number of bytes read from the bus during the calls"""
+        self.time_ns = 0
+        """The wall time spent in the calls, in nanoseconds"""
+
+    def as_dict(self) -> Dict[str, int]:
+        """The totals as a dictionary, ready to be written out as JSON"""
+        return {
+            "calls": self.calls,
+            "transactions": self.transactions,
+            "bytes_written": self.bytes_written,
+            "bytes_read": self.bytes_read,
+            "time_ns": self.time_ns,
+        }
+
+
+def _length(buffer, start: int = 0, end: Optional[int] = None) -> int:
+    """The number of bytes from start to end of a buffer, which busio counts in items"""
+    view = memoryview(buffer)
+    if end is None:
+        end = len(view)
+    # The size of one item, as not every memoryview has itemsize
+    return (end - start) * len(bytes(view[0:1]))
+
+
+class _Probe:
+    """Stands in for a driver, timing each method call and property access"""
+
+    def __init__(self, profiler: "Profiler", label: str, target: Any):
+        # __setattr__ forwards to the target, so set these in the instance dict
+        self.__dict__["_profiler"] = profiler
+        self.__dict__["_label"] = label
+        self.__dict__["_target"] = target
+
+    def _is_property(self, name: str) -> bool:
+        attribute = getattr(type(self._target), name, None)
+        return isinstance(attribute, property) or hasattr(attribute, "__set__")
+
+    def _timed(self, name: str, function, *args, **kwargs):
+        profiler = self._profiler
+        stats = profiler.record(self._label + "." + name)
+        profiler._active.append(stats)
+        start = time.monotonic_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            stats.time_ns += time.monotonic_ns() - start
+            stats.calls += 1
+            profiler._active.pop()
+
+    def __getattr__(self, name: str):
+        target = self._target
+        if self._is_property(name):
+            return self._timed(name, getattr, target, name)
+        value = getattr(target, name)
+        if not callable(value):
+            return value
+
+        def timed(*args, **kwargs):
+            return self._timed(name, value, *args, **kwargs)
+
+        return timed
+
+    def __setattr__(self, name: str, value: Any):
+        if self._is_property(name):
+            self._timed(name, setattr, self._target, name, value)
+        else:
+            setattr(self._target, name, value)
+
+    def __getitem__(self, index):
+        return self._timed("__getitem__", self._target.__getitem__, index)
+
+    def __setitem__(self, index, value):
+        self._timed("__setitem__", self._target.__setitem__, index, value)
+
+    def __repr__(self):
+        return f"<probe {self._label} for {self._target!r}>"
+
+
+class _BusProbe(_Probe):
+    """Stands in for an I2C bus or a UART, counting the bytes each transaction moves
+    against itself and against the driver call it was made from"""
+
+    def _count(self, written: int, read: int, start: int):
+        elapsed = time.monotonic_ns() - start
+        profiler = self._profiler
+        stats = profiler.record(self._label)
+        stats.calls += 1
+        stats.time_ns += elapsed
+        for totals in (stats, profiler._active[-1] if profiler._active else None):
+            if totals is not None:
+                totals.transactions += 1
+                totals.bytes_written += written
+                totals.bytes_read += read
+
+    def __getattr__(self, name: str):
+        if name in _BUS_METHODS:
+            return getattr(self, "_" + name)
+        return getattr(self._target, name)
+
+    def _writeto(self, address: int, buffer, *, start: int = 0, end: Optional[int] = None):
+        begin = time.monotonic_ns()
+        self._target.writeto(address, buffer, start=start, end=end)
+        self._count(_length(buffer, start, end), 0, begin)
+
+    def _readfrom_into(self, address: int, buffer, *, start: int = 0, end: Optional[int] = None):
+        begin = time.monotonic_ns()
+        self._target.readfrom_into(address, buffer, start=start, end=end)
+        self._count(0, _length(buffer, start, end), begin)
+
+    def _writeto_then_readfrom(
+        self,
+        address: int,
+        out_buffer,
+        in_buffer,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ):
+        begin = time.monotonic_ns()
+        self._target.writeto_then_readfrom(
+            address,
+            out_buffer,
+            in_buffer,
+            out_start=out_start,
+            out_end=out_end,
+            in_start=in_start,
+            in_end=in_end,
+        )
+        self._count(
+            _length(out_buffer, out_start, out_end), _length(in_buffer, in_start, in_end), begin
+        )
+
+    def _read(self, nbytes: Optional[int] = None) -> Optional[bytes]:
+        begin = time.monotonic_ns()
+        data = self._target.read(nbytes)
+        self._count(0, len(data) if data else 0, begin)
+        return data
+
+    def _readinto(self, buffer) -> Optional[int]:
+        begin = time.monotonic_ns()
+        count = self._target.readinto(buffer)
+        self._count(0, count or 0, begin)
+        return count
+
+    def _readline(self) -> Optional[bytes]:
+        begin = time.monotonic_ns()
+        data = self._target.readline()
+        self._count(0, len(data) if data else 0, begin)
+        return data
+
+    def _write(self, buffer) -> Optional[int]:
+        begin = time.monotonic_ns()
+        count = self._target.write(buffer)
+        self._count(len(buffer), 0, begin)
+        return count
+
+
+_BUS_METHODS = (
+    "writeto",
+    "readfrom_into",
+    "writeto_then_readfrom",
+    "read",
+    "readinto",
+    "readline",
+    "write",
+)
+
+
+class Profiler:
+    """Collects the totals for the drivers of one or more instrumented wings
+
+    :param bool enabled: (Optional) Whether to start counting straight away (default=True)
+    """
+
+    def __init__(self, enabled: bool = True):
+        self._enabled = enabled
+        self.records = {}
+        """The `CallStats` for each method and property, by name"""
+        self._active = []
+        # The holder, attribute, original value and probe of each probe put in
+        self._patches = []
+
+    @property
+    def enabled(self):
+        """Whether calls are being counted. Disabling the profiler puts the original
+        drivers and buses back, and enabling it puts the probes in again."""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled: bool):
+        if enabled == self._enabled:
+            return
+        self._enabled = enabled
+        patches = self._patches if enabled else reversed(self._patches)
+        for holder, attribute, original, probe in patches:
+            setattr(holder, attribute, probe if enabled else original)
+
+    def record(self, name: str) -> CallStats:
+        """The totals for a name, created if they don't exist yet
+
+        :param str name: The name, such as ``"RTCFeatherWing._rtc.datetime"``
+        """
+        stats = self.records.get(name)
+        if stats is None:
+            stats = self.records[name] = CallStats()
+        return stats
+
+    def _patch(self, holder: Any, attribute: str, probe: Any):
+        # A disabled profiler has taken its probes out, so check the list as well
+        for patch in self._patches:
+            if patch[0] is holder and patch[1] == attribute:
+                return
+        self._patches.append((holder, attribute, getattr(holder, attribute), probe))
+        if self._enabled:
+            setattr(holder, attribute, probe)
+
+    def instrument(self, wing: Any, name: Optional[str] = None) -> List[str]:
+        """Put probes in front of the drivers a wing holds and the I2C buses they use
+
+        :param wing: The FeatherWing helper to instrument
+        :param str name: (Optional) The prefix for the records. Defaults to the class
+                         name of the wing.
+        :return: The names of the attributes that were instrumented
+        """
+        if name is None:
+            name = type(wing).__name__
+        found = []
+        for attribute in DRIVER_ATTRIBUTES:
+            driver = getattr(wing, attribute, None)
+            if driver is None or isinstance(driver, _Probe):
+                continue
+            label = name + "." + attribute
+            if attribute == "_uart":
+                probe = _BusProbe(self, label, driver)
+                # The GPS driver and stream hold the UART as well
+                for held in wing.__dict__.values():
+                    if getattr(held, "_uart", None) is driver:
+                        self._patch(held, "_uart", probe)
+            else:
+                probe = _Probe(self, label, driver)
+                self._probe_buses(driver, label)
+            self._patch(wing, attribute, probe)
+            found.append(attribute)
+        # Some wings write to their display through an I2CDevice of their own
+        self._probe_buses(wing, name)
+        return found
+
+    def _probe_buses(self, holder: Any, label: str):
+        """Put probes in front of the buses of the I2CDevices an object holds"""
+        for attribute, held in holder.__dict__.items():
+            # Display RAM writers hold their I2CDevice as i2c_device
+            devices = held if isinstance(held, list) else (held, getattr(held, "i2c_device", None))
+            for device in devices:
+                bus = getattr(device, "i2c", None)
+                if hasattr(device, "device_address") and not isinstance(bus, _BusProbe):
+                    self._patch(device, "i2c", _BusProbe(self, f"{label}.{attribute}.i2c", bus))
+
+    def uninstrument(self):
+        """Take out every probe this profiler put in, leaving the records"""
+        while self._patches:
+            holder, attribute, original, _ = self._patches.pop()
+            setattr(holder, attribute, original)
+
+    def reset(self):
+        """Clear the records"""
+        self.records = {}
+
+    def report(self) -> List[Dict[str, Any]]:
+        """The records with the most time first, ready to be written out as JSON.
+        The time and bytes of a driver call include the bus transactions it made."""
+        rows = []
+        for name, stats in self.records.items():
+            row = stats.as_dict()
+            row["name"] = name
+            rows.append(row)
+        rows.sort(key=lambda row: row["time_ns"], reverse=True)
+        return rows
+
+    def dump(self, stream: Optional[Any] = None):
+        """Print the report as a table
+
+        :param stream: (Optional) Where to write the table. Defaults to ``sys.stdout``.
+        """
+        if stream is None:
+            stream = sys.stdout
+        rows = self.report()
+        width = max([len(row["name"]) for row in rows] + [4])
+        stream.write(
+            f"{'name':<{width}} {'calls':>8} {'trans':>8} {'written':>9} {'read':>9}"
+            f" {'total ms':>10} {'us/call':>9}\n"
+        )
+        for row in rows:
+            per_call = row["time_ns"] / row["calls"] / 1000 if row["calls"] else 0
+            stream.write(
+                f"{row['name']:<{width}} {row['calls']:>8} {row['transactions']:>8}"
+                f" {row['bytes_written']:>9} {row['bytes_read']:>9}"
+                f" {row['time_ns'] / 1000000:>10.3f} {per_call:>9.1f}\n"
+            )
@@ -14,14 +14,21 @@ Helper for using the `Joy FeatherWing <https://www.adafruit.com/product/3632>`_.
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FeatherWing.git"
 
+import time
+from collections import namedtuple
+
 import adafruit_seesaw.seesaw
 import board
+import digitalio
 from micropython import const
 
+from adafruit_featherwing.event_queue import EventQueue
+
 try:
     from typing import Optional, Tuple
 
     from busio import I2C
+    from microcontroller import Pin
 except ImportError:
     pass
 
@@ -31,6 +38,10 @@ BUTTON_B = const(1 << 7)
 BUTTON_Y = const(1 << 9)
 BUTTON_X = const(1 << 10)
 BUTTON_SELECT = const(1 << 14)
+_BUTTONS = const(BUTTON_A | BUTTON_B | BUTTON_Y | BUTTON_X | BUTTON_SELECT)
+
+JoyState = namedtuple("JoyState", "buttons x y")
+ButtonEvent = namedtuple("ButtonEvent", "button pressed timestamp")
 
 
 class JoyFeatherWing:
@@ -42,14 +53,22 @@ class JoyFeatherWing:
         if i2c is None:
             i2c = board.I2C()
         self._seesaw = adafruit_seesaw.seesaw.Seesaw(i2c)
-        self._seesaw.pin_mode_bulk(
-            BUTTON_A | BUTTON_B | BUTTON_Y | BUTTON_X | BUTTON_SELECT,
-            self._seesaw.INPUT_PULLUP,
-        )
+        self._seesaw.pin_mode_bulk(_BUTTONS, self._seesaw.INPUT_PULLUP)
 
         # Initialise joystick_offset
         self._joystick_offset = (0, 0)
 
+        self._snapshot = False
+        self._state = None
+
+        # Button events, see enable_events()
+        self._irq = None
+        self._events = None
+        self._debounce = 0
+        self._pressed = 0
+        self._last_change = {}
+        self._recheck_time = None
+
     @property
     def button_a(self):
         """Joy featherwing button A.
@@ -167,9 +186,189 @@ class JoyFeatherWing:
 
     def _check_button(self, button: int) -> bool:
         """Utilises the seesaw to determine which button is being pressed."""
+        if self._snapshot:
+            return bool(self.read_state().buttons & button)
+        if self._irq is not None:
+            self.update_events()
+            return bool(self._pressed & button)
         buttons = self._seesaw.digital_read_bulk(button)
         return not buttons != 0
 
+    def read_state(self) -> JoyState:
+        """Read all five buttons and both joystick axes together.
+
+        The buttons come from a single bulk read and are returned as a bitmask
+        of the ``BUTTON_*`` values that are pressed. The joystick axes have the
+        offset applied. When `snapshot` is enabled, the same state is returned
+        until `invalidate` is called.
+
+        This example polls the whole controller once per frame.
+
+        .. code-block:: python
+
+            from adafruit_featherwing import joy_featherwing
+            import time
+
+            wing = joy_featherwing.JoyFeatherWing()
+
+            while True:
+                state = wing.read_state()
+                if state.buttons & joy_featherwing.BUTTON_A:
+                    print("Button A pressed!")
+                print(state.x, state.y)
+                time.sleep(0.01)
+
+        """
+        if self._snapshot and self._state is not None:
+            return self._state
+        if self._irq is not None:
+            self.update_events()
+            buttons = self._pressed
+        else:
+            buttons = ~self._seesaw.digital_read_bulk(_BUTTONS) & _BUTTONS
+        x, y = self._read_joystick()
+        self._state = JoyState(buttons, x, y)
+        return self._state
+
+    @property
+    def snapshot(self):
+        """Whether the buttons and joystick reuse one state read until `invalidate`
+        is called. Call `invalidate` once per loop so every property read in that
+        loop comes from the same read.
+
+        With `enable_events`, `update_events` keeps queueing events, but the buttons in
+        the saved state only change once `invalidate` is called.
+
+        This example reads all of the controls with one state read per loop.
+
+        .. code-block:: python
+
+            from adafruit_featherwing import joy_featherwing
+            import time
+
+            wing = joy_featherwing.JoyFeatherWing()
+            wing.snapshot = True
+
+            while True:
+                wing.invalidate()
+                if wing.button_a or wing.button_b:
+                    print("Fire!")
+                print(wing.joystick)
+                time.sleep(0.01)
+
+        """
+        return self._snapshot
+
+    @snapshot.setter
+    def snapshot(self, snapshot: bool):
+        self._snapshot = snapshot
+        self._state = None
+
+    def invalidate(self):
+        """Discard the saved state so the next read comes from the seesaw."""
+        self._state = None
+
+    def enable_events(self, irq_pin: Pin, queue_size: int = 16, debounce: float = 0.02):
+        """Queue button press and release events using the seesaw interrupt.
+
+        The seesaw pulls the IRQ line low when a button changes, so the buttons
+        are only read from the seesaw when it is asserted. While events are
+        enabled, the button properties also use the last read state.
+
+        :param pin irq_pin: The pin the Joy FeatherWing IRQ jumper is connected to
+        :param int queue_size: (Optional) The number of events to hold (default=16)
+        :param float debounce: (Optional) The time in seconds a button must stay in
+                               one state before another change is accepted (default=0.02)
+
+        This example prints the button events as they happen.
+
+        .. code-block:: python
+
+            import board
+            from adafruit_featherwing import joy_featherwing
+
+            wing = joy_featherwing.JoyFeatherWing()
+            wing.enable_events(board.D5)
+
+            while True:
+                wing.update_events()
+                event = wing.get_event()
+                while event:
+                    print(event.button, "pressed" if event.pressed else "released")
+                    event = wing.get_event()
+
+        """
+        events = EventQueue(queue_size)
+        if self._irq is not None:
+            self._irq.deinit()
+        self._irq = digitalio.DigitalInOut(irq_pin)
+        self._irq.switch_to_input(pull=digitalio.Pull.UP)
+        self._events = events
+        self._debounce = debounce
+        self._last_change = {}
+        self._recheck_time = None
+        self._seesaw.set_GPIO_interrupts(_BUTTONS, True)
+        # Clear anything already flagged and start from the current state
+        self._seesaw.get_GPIO_interrupt_flag()
+        self._pressed = ~self._seesaw.digital_read_bulk(_BUTTONS) & _BUTTONS
+
+    def disable_events(self):
+        """Stop queueing button events and go back to reading the seesaw directly."""
+        if self._irq is None:
+            return
+        self._seesaw.set_GPIO_interrupts(_BUTTONS, False)
+        self._irq.deinit()
+        self._irq = None
+        self._events = None
+
+    def update_events(self) -> int:
+        """Read the buttons if the IRQ line is asserted and queue any changes.
+        This does not use the I2C bus while no buttons have changed.
+
+        :return: The number of events added to the queue
+        :rtype: int
+        """
+        if self._irq is None:
+            raise RuntimeError("Events have not been enabled")
+        now = time.monotonic()
+        if self._irq.value and (self._recheck_time is None or now < self._recheck_time):
+            return 0
+        self._recheck_time = None
+        # Reading the flags releases the IRQ line
+        self._seesaw.get_GPIO_interrupt_flag()
+        pressed = ~self._seesaw.digital_read_bulk(_BUTTONS) & _BUTTONS
+        changed = pressed ^ self._pressed
+        added = 0
+        for button in (BUTTON_A, BUTTON_B, BUTTON_X, BUTTON_Y, BUTTON_SELECT):
+            if not changed & button:
+                continue
+            last_change = self._last_change.get(button)
+            if last_change is not None and now - last_change < self._debounce:
+                # Still bouncing, look again once it has had time to settle
+                self._recheck_time = last_change + self._debounce
+                continue
+            self._last_change[button] = now
+            self._pressed ^= button
+            added += self._events.put(ButtonEvent(button, bool(pressed & button), now))
+        return added
+
+    def get_event(self) -> Optional[ButtonEvent]:
+        """Remove and return the oldest queued button event.
+
+        :return: A ButtonEvent of the ``BUTTON_*`` value, whether it was pressed and the
+                 ``time.monotonic()`` time, or None if the queue is empty
+        """
+        if self._events is None:
+            return None
+        return self._events.get()
+
+    @property
+    def dropped_events(self):
+        """The number of button events dropped because the queue was full."""
+        if self._events is None:
+            return 0
+        return self._events.dropped
+
     @property
     def joystick_offset(self):
         """Offset used to correctly report (0, 0) when the joystick is centered.
@@ -207,6 +406,7 @@ class JoyFeatherWing:
     @joystick_offset.setter
     def joystick_offset(self, offset: Tuple[int, int]):
         self._joystick_offset = offset
+        self._state = None
 
     def zero_joystick(self):
         """Zeros the joystick by using current reading as (0, 0).
@@ -236,7 +436,8 @@ class JoyFeatherWing:
 
         """
         self._joystick_offset = (0, 0)
-        self._joystick_offset = self.joystick
+        self._joystick_offset = self._read_joystick()
+        self._state = None
 
     @property
     def joystick(self):
@@ -266,6 +467,13 @@ class JoyFeatherWing:
                     print(x, y)
                 time.sleep(0.01)
         """
+        if self._snapshot:
+            state = self.read_state()
+            return state.x, state.y
+        return self._read_joystick()
+
+    def _read_joystick(self) -> Tuple[int, int]:
+        """Read both joystick axes from the seesaw and apply the offset."""
         x = int(127 - self._seesaw.analog_read(2) / 4) - self._joystick_offset[0]
         y = int(self._seesaw.analog_read(3) / 4 - 127) - self._joystick_offset[1]
         return x, y
@@ -19,10 +19,7 @@ Requires:
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FeatherWing.git"
 
-import adafruit_ili9341
 import board
-import neopixel
-from bbq10keyboard import BBQ10Keyboard
 
 from adafruit_featherwing.tft_featherwing import TFTFeatherWing
 
@@ -50,6 +47,10 @@ class KeyboardFeatherwing(TFTFeatherWing):
         sd_cs: Optional[Pin] = None,
         neopixel_pin: Optional[Pin] = None,
     ):
+        import adafruit_ili9341
+        import neopixel
+        from bbq10keyboard import BBQ10Keyboard
+
         super().__init__(spi, cs, dc, ts_cs, sd_cs)
 
         if i2c is None:
@@ -14,17 +14,26 @@ Base Class for the AlphaNumeric FeatherWing and 7-Segment FeatherWing helpers.
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FeatherWing.git"
 
+import time
+
 try:
-    from typing import Union
+    from typing import List, Optional, Union
 except ImportError:
     pass
 
+# The number of rendered values to keep for print()
+_CACHE_SIZE = 16
+
 
 class Segments:
     """Base Class for the AlphaNumeric FeatherWing and 7-Segment FeatherWing helpers."""
 
     def __init__(self):
         self._segments = None
+        self._ram = None
+        self._cache = {}
+        # The cache keys, least recently used first
+        self._cache_keys = []
 
     def print(self, value: Union[str, int]):
         """
@@ -38,8 +47,51 @@ class Segments:
         if isinstance(value, float) and len(str(value)) > 5:
             value = round(value)
 
-        self._segments.print(value)
-        self._segments.show()
+        # Short values scroll onto what is already shown, so that is part of the key.
+        # The type keeps values that compare equal, such as True and 1, apart.
+        buffer = self._segments._buffer
+        key = (type(value), value, bytes(buffer[1:17]))
+        rendered = self._cache.get(key)
+        if rendered is None:
+            self._segments.print(value)
+            rendered = bytes(buffer[1:17])
+            if len(self._cache_keys) >= _CACHE_SIZE:
+                del self._cache[self._cache_keys.pop(0)]
+            self._cache[key] = rendered
+        else:
+            buffer[1:17] = rendered
+            self._cache_keys.remove(key)
+        self._cache_keys.append(key)
+        self._show()
+
+    def _show(self):
+        """
+        Send only the span of display RAM that changed since the last update,
+        in a single I2C write
+        """
+        # Byte 0 of the driver buffer is the display RAM address
+        self._ram.write(self._segments._buffer, 1)
+
+    def _render(self, frames: List[str]) -> List[bytes]:
+        """
+        Render each frame to the 16 bytes of display RAM it shows, leaving what is
+        on the display alone
+        """
+        buffer = self._segments._buffer
+        shown = bytes(buffer[1:17])
+        images = []
+        for frame in frames:
+            self._segments.print(frame)
+            images.append(bytes(buffer[1:17]))
+        buffer[1:17] = shown
+        return images
+
+    def _show_image(self, image: bytes):
+        """
+        Show 16 bytes of display RAM rendered by `_render`
+        """
+        self._segments._buffer[1:17] = image
+        self._show()
 
     def marquee(self, text: str, delay: float = 0.25, loop: bool = True):
         """
@@ -51,7 +103,41 @@ class Segments:
         :param bool loop: (optional) Whether to endlessly loop the text (default=True)
 
         """
-        self._segments.marquee(text, delay, loop)
+        if not isinstance(text, str) or not text:
+            return
+        # The driver's marquee relies on auto_write, which is off, so step the frames here
+        marquee = Marquee(self, text, delay, loop)
+        while True:
+            marquee.tick()
+            if marquee.done:
+                return
+            time.sleep(max(0.0, marquee.next_time - time.monotonic()))
+
+    def start_marquee(self, text: str, delay: float = 0.25, loop: bool = True) -> "Marquee":
+        """
+        Create a marquee that scrolls the text without blocking. Call ``tick()`` on
+        the returned object from the main loop to show each frame when it is due.
+
+        :param str text: The text to display
+        :param float delay: (optional) The delay in seconds to pause before scrolling
+                            to the next character (default=0.25)
+        :param bool loop: (optional) Whether to endlessly loop the text (default=True)
+
+        This example scrolls text while still doing other work.
+
+        .. code-block:: python
+
+            from adafruit_featherwing import alphanum_featherwing
+
+            display = alphanum_featherwing.AlphaNumFeatherWing()
+            marquee = display.start_marquee("This is a scrolling marquee ")
+
+            while True:
+                marquee.tick()
+                # Do other work here
+
+        """
+        return Marquee(self, text, delay, loop)
 
     def fill(self, fill: bool):
         """Change all Segments on or off
@@ -61,7 +147,7 @@ class Segments:
         """
         if isinstance(fill, bool):
             self._segments.fill(1 if fill else 0)
-            self._segments.show()
+            self._show()
         else:
             raise ValueError("Must set to either True or False.")
 
@@ -91,3 +177,128 @@ class Segments:
         if not 0 <= brightness <= 15:
             raise ValueError("Brightness must be a value between 0 and 15")
         self._segments.brightness = brightness / 15
+
+
+class Marquee:
+    """A marquee for `Segments` that is stepped from the main loop.
+
+    Each scroll step is rendered to display RAM when the marquee is created, so
+    showing a frame only has to write the bytes that changed.
+
+    :param Segments display: The display to scroll the text on
+    :param str text: The text to display
+    :param float delay: (optional) The delay in seconds between frames (default=0.25)
+    :param bool loop: (optional) Whether to endlessly loop the text (default=True)
+    :param int digits: (optional) The number of digits on the display (default=4)
+    """
+
+    def __init__(
+        self,
+        display: Segments,
+        text: str,
+        delay: float = 0.25,
+        loop: bool = True,
+        digits: int = 4,
+    ):
+        if not isinstance(text, str) or not text:
+            raise ValueError("Text must be a non-empty string")
+        self._display = display
+        self._delay = delay
+        self._loop = loop
+        cells = self._split_cells(text)
+        count = len(cells)
+        # The text scrolls in from a blank display. When looping, the frames
+        # repeat once the blank digits have scrolled off.
+        first_count = count
+        if loop:
+            first_count *= max(1, (digits - 2) // count + 1)
+        self._first_frames = display._render(self._build_frames(cells, digits, 0, first_count))
+        self._loop_frames = (
+            display._render(self._build_frames(cells, digits, first_count, count)) if loop else None
+        )
+        self._frames = self._first_frames
+        self._index = 0
+        self._next_time = None
+        self._done = False
+
+    @staticmethod
+    def _split_cells(text: str) -> List[str]:
+        """
+        Split the text into what each digit shows, attaching a decimal point to
+        the character before it the way the display does
+        """
+        cells = []
+        for character in text:
+            if character == "." and cells and not cells[-1].endswith("."):
+                cells[-1] += "."
+            elif character == ".":
+                cells.append(" .")
+            else:
+                cells.append(character)
+        return cells
+
+    @staticmethod
+    def _build_frames(cells: List[str], digits: int, start: int, count: int) -> List[str]:
+        """
+        Build the frames for a run of scroll steps through the repeating cells
+        """
+        frames = []
+        for end in range(start, start + count):
+            frame = ""
+            for position in range(end - digits + 1, end + 1):
+                frame += cells[position % len(cells)] if position >= 0 else " "
+            frames.append(frame)
+        return frames
+
+    @property
+    def done(self):
+        """
+        Whether the marquee has shown all of its frames. Never True when looping.
+        """
+        return self._done
+
+    @property
+    def next_time(self):
+        """
+        The ``time.monotonic()`` time the next frame is due, or None before the first
+        frame is shown
+        """
+        return self._next_time
+
+    def tick(self, now: Optional[float] = None) -> bool:
+        """
+        Show the next frame if it is due
+
+        :param float now: (optional) The current ``time.monotonic()`` value
+        :return: Whether a new frame was shown
+        :rtype: bool
+        """
+        if self._done:
+            return False
+        if now is None:
+            now = time.monotonic()
+        if self._next_time is not None and now < self._next_time:
+            return False
+        self._display._show_image(self._frames[self._index])
+        if self._next_time is None or now - self._next_time >= self._delay:
+            # Start over from now rather than trying to catch up
+            self._next_time = now + self._delay
+        else:
+            self._next_time += self._delay
+        self._index += 1
+        if self._index == len(self._frames):
+            if self._loop:
+                self._frames = self._loop_frames
+                self._index = 0
+            else:
+                self._done = True
+        return True
+
+    def reset(self):
+        """
+        Start the marquee over from the beginning on the next tick
+        """
+        self._frames = self._first_frames
+        self._index = 0
+        self._next_time = None
+        self._done = False
@@ -19,14 +19,18 @@ import board
 from adafruit_ht16k33 import matrix
 
 from adafruit_featherwing.auto_writeable import AutoWriteable
+from adafruit_featherwing.ht16k33_ram import HT16K33RAM
 
 try:
-    from typing import Optional, Tuple, Union
+    from typing import List, Optional, Tuple, Union
 
     from busio import I2C
 except ImportError:
     pass
 
+# Display RAM address of each column, from left to right
+_COLUMNS = (0, 2, 4, 6, 8, 10, 12, 14, 1, 3, 5, 7, 9, 11, 13, 15)
+
 
 class MatrixFeatherWing(AutoWriteable):
     """Class representing an `Adafruit 8x16 LED Matrix FeatherWing
@@ -39,6 +43,9 @@ class MatrixFeatherWing(AutoWriteable):
             i2c = board.I2C()
         self._matrix = matrix.Matrix16x8(i2c, address)
         self._matrix.auto_write = False
+        self._ram = HT16K33RAM(i2c, address)
+        # One byte per column with a bit for each row
+        self._buffer = bytearray(16)
         self.columns = 16
         self.rows = 8
         super().__init__()
@@ -56,14 +63,13 @@ class MatrixFeatherWing(AutoWriteable):
         """
         x, y = key
         self.pixel(x, y, value)
-        self._update()
 
     def _update(self):
         """
         Update the Display automatically if auto_write is set to True
         """
         if self._auto_write:
-            self._matrix.show()
+            self.show()
 
     def pixel(self, x: int, y: int, color: Optional[bool] = None) -> Optional[bool]:
         """
@@ -74,16 +80,28 @@ class MatrixFeatherWing(AutoWriteable):
         :param color: Whether to turn the pixel on or off
         :type color: int or bool
         """
-        value = self._matrix.pixel(x, y, color)
+        if not 0 <= x < self.columns or not 0 <= y < self.rows:
+            return None
+        address = _COLUMNS[x]
+        mask = 1 << y
+        if color is None:
+            return bool(self._buffer[address] & mask)
+        if color:
+            self._buffer[address] |= mask
+        else:
+            self._buffer[address] &= ~mask
         self._update()
-        return value
+        return None
 
     def show(self):
         """
         Update the Pixels. This is only needed if auto_write is set to False
         This can be very useful for more advanced graphics effects.
+
+        Only the span of columns that changed since the last update is sent,
+        in a single I2C write, and nothing is sent if nothing changed.
         """
-        self._matrix.show()
+        self._ram.write(self._buffer)
 
     def fill(self, fill: bool):
         """
@@ -93,7 +111,7 @@ class MatrixFeatherWing(AutoWriteable):
 
         """
         if isinstance(fill, bool):
-            self._matrix.fill(1 if fill else 0)
+            self._buffer[:] = (b"\xff" if fill else b"\x00") * 16
             self._update()
         else:
             raise ValueError("Must set to either True or False.")
@@ -104,8 +122,8 @@ class MatrixFeatherWing(AutoWriteable):
 
         :param rotate: (Optional) Rotate the shifted pixels to the left side (default=False)
         """
-        self._matrix.shift_right(rotate)
-        self._update()
+        columns = [self._buffer[address] for address in _COLUMNS]
+        self._set_columns([columns[-1] if rotate else 0] + columns[:-1])
 
     def shift_left(self, rotate: bool = False):
         """
@@ -113,8 +131,8 @@ class MatrixFeatherWing(AutoWriteable):
 
         :param rotate: (Optional) Rotate the shifted pixels to the right side (default=False)
         """
-        self._matrix.shift_left(rotate)
-        self._update()
+        columns = [self._buffer[address] for address in _COLUMNS]
+        self._set_columns(columns[1:] + [columns[0] if rotate else 0])
 
     def shift_up(self, rotate: bool = False):
         """
@@ -122,7 +140,10 @@ class MatrixFeatherWing(AutoWriteable):
 
         :param rotate: (Optional) Rotate the shifted pixels to bottom (default=False)
         """
-        self._matrix.shift_up(rotate)
+        buffer = self._buffer
+        for address in range(16):
+            column = buffer[address]
+            buffer[address] = ((column << 1) & 0xFF) | (column >> 7 if rotate else 0)
         self._update()
 
     def shift_down(self, rotate: bool = False):
@@ -131,7 +152,18 @@ class MatrixFeatherWing(AutoWriteable):
 
         :param rotate: (Optional) Rotate the shifted pixels to top (default=False)
         """
-        self._matrix.shift_down(rotate)
+        buffer = self._buffer
+        for address in range(16):
+            column = buffer[address]
+            buffer[address] = (column >> 1) | ((column & 1) << 7 if rotate else 0)
+        self._update()
+
+    def _set_columns(self, columns: List[int]):
+        """
+        Store a list of column values ordered from left to right
+        """
+        for address, column in zip(_COLUMNS, columns):
+            self._buffer[address] = column
         self._update()
 
     @property
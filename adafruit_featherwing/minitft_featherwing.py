@@ -18,11 +18,6 @@ __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FeatherWing.git"
 from collections import namedtuple
 
 import board
-import displayio
-import fourwire
-from adafruit_seesaw.pwmout import PWMOut
-from adafruit_seesaw.seesaw import Seesaw
-from adafruit_st7735r import ST7735R
 from micropython import const
 
 try:
@@ -69,6 +64,12 @@ class MiniTFTFeatherWing:
         cs_pin: Optional[Pin] = None,
         dc_pin: Optional[Pin] = None,
     ):
+        import displayio
+        import fourwire
+        from adafruit_seesaw.pwmout import PWMOut
+        from adafruit_seesaw.seesaw import Seesaw
+        from adafruit_st7735r import ST7735R
+
         displayio.release_displays()
         if i2c is None:
             i2c = board.I2C()
@@ -37,6 +37,8 @@ class PixelMatrix(AutoWriteable):
         self.rows = 0
         self.columns = 0
         self._matrix = None
+        self._framebuffer = None
+        self._dirty = None
         super().__init__()
 
     def __setitem__(self, indices: IndexUnion, value: ValueUnion):
@@ -51,8 +53,15 @@ class PixelMatrix(AutoWriteable):
                 a single, longer int that contains RGB values, like 0xFFFFFF
             brightness, if specified should be a float 0-1
         """
-        self._matrix[self._get_index(indices)] = value
-        self._update()
+        index = self._get_index(indices)
+        if self._framebuffer is None:
+            self._matrix[index] = value
+            self._update()
+        elif isinstance(index, slice):
+            for value_index, pixel in enumerate(range(*index.indices(self.rows * self.columns))):
+                self._set_pixel(pixel, value[value_index])
+        else:
+            self._set_pixel(index, value)
 
     def __getitem__(self, indices: IndexUnion) -> Tuple[int, int, int]:
         """
@@ -61,7 +70,51 @@ class PixelMatrix(AutoWriteable):
             a slice of DotStar indexes to retrieve
             a single int that specifies the DotStar index
         """
-        return self._matrix[self._get_index(indices)]
+        index = self._get_index(indices)
+        if self._framebuffer is None:
+            return self._matrix[index]
+        if isinstance(index, slice):
+            return [
+                self._get_pixel(pixel) for pixel in range(*index.indices(self.rows * self.columns))
+            ]
+        return self._get_pixel(index)
+
+    @staticmethod
+    def _pack(value: ValueUnion) -> bytes:
+        """
+        Convert a color value into packed RGB bytes for the framebuffer
+        """
+        if isinstance(value, int):
+            return bytes(((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF))
+        if len(value) == 4:
+            # Per pixel brightness is folded into the color
+            return bytes(int(color * value[3]) for color in value[:3])
+        return bytes(value[:3])
+
+    def _set_pixel(self, index: int, value: ValueUnion):
+        """
+        Write a single pixel into the framebuffer and mark it as changed
+        """
+        offset = index * 3
+        self._framebuffer[offset : offset + 3] = self._pack(value)
+        self._mark_dirty(index, index + 1)
+
+    def _get_pixel(self, index: int) -> Tuple[int, int, int]:
+        """
+        Read a single pixel back from the framebuffer
+        """
+        offset = index * 3
+        return tuple(self._framebuffer[offset : offset + 3])
+
+    def _mark_dirty(self, start: int, end: int):
+        """
+        Grow the range of pixels that need to be sent on the next show()
+        """
+        if self._dirty is None:
+            self._dirty = [start, end]
+        else:
+            self._dirty[0] = min(self._dirty[0], start)
+            self._dirty[1] = max(self._dirty[1], end)
 
     def _get_index(self, indices: IndexUnion) -> Union[int, slice]:
         """
@@ -84,9 +137,10 @@ class PixelMatrix(AutoWriteable):
 
     def _update(self):
         """
-        Update the Display automatically if auto_write is set to True
+        Update the Display automatically if auto_write is set to True.
+        When buffered, changes wait for the next call to show()
         """
-        if self._auto_write:
+        if self._auto_write and self._framebuffer is None:
             self._matrix.show()
 
     def fill(self, color: Sequence[int] = 0):
@@ -96,28 +150,119 @@ class PixelMatrix(AutoWriteable):
         :param color: (Optional) The text or number to display (default=0)
         :type color: list/tuple or int
         """
-        self._matrix.fill(color)
-        self._update()
+        if self._framebuffer is None:
+            self._matrix.fill(color)
+            self._update()
+        else:
+            count = self.rows * self.columns
+            self._framebuffer[:] = self._pack(color) * count
+            self._mark_dirty(0, count)
 
     def show(self):
         """
         Update the Pixels. This is only needed if auto_write is set to False
-        This can be very useful for more advanced graphics effects.
+        or the display is buffered. This can be very useful for more advanced
+        graphics effects.
+
+        When buffered, only the pixels changed since the last frame are sent to
+        the driver and nothing is sent at all if the frame did not change.
         """
+        if self._framebuffer is not None:
+            if self._dirty is None:
+                return
+            start, end = self._dirty
+            self._dirty = None
+            if start < end:
+                buffer = self._framebuffer
+                self._matrix[start:end] = [
+                    tuple(buffer[offset : offset + 3]) for offset in range(start * 3, end * 3, 3)
+                ]
         self._matrix.show()
 
+    @property
+    def buffered(self):
+        """
+        Whether drawing goes to an off-screen framebuffer of packed RGB bytes
+        instead of straight to the Pixels. While buffered, auto_write is ignored
+        and a frame is sent with a single call to show().
+
+        This example draws a full frame and sends it in one transmission.
+
+        .. code-block:: python
+
+            from adafruit_featherwing import neopixel_featherwing
+
+            neopixel = neopixel_featherwing.NeoPixelFeatherWing()
+            neopixel.buffered = True
+
+            for x in range(0, neopixel.columns):
+                for y in range(0, neopixel.rows):
+                    neopixel[x, y] = (x * 32, y * 64, 0)
+            neopixel.show()
+
+        """
+        return self._framebuffer is not None
+
+    @buffered.setter
+    def buffered(self, buffered: bool):
+        if not isinstance(buffered, bool) or buffered == self.buffered:
+            return
+        if buffered:
+            count = self.rows * self.columns
+            self._framebuffer = bytearray(count * 3)
+            for index, value in enumerate(self._matrix[0:count]):
+                self._framebuffer[index * 3 : index * 3 + 3] = self._pack(value[:3])
+            self._dirty = None
+        else:
+            self.show()
+            self._framebuffer = None
+
+    def _shift(self, x: int, y: int, rotate: bool):
+        """
+        Move every pixel by one step, working on whole rows at a time. The
+        pixels are read from the driver in one slice and written back in one
+        slice, so colors are only encoded once per pixel.
+        """
+        count = self.rows * self.columns
+        if self._framebuffer is None:
+            # One list item per pixel
+            pixels = self._matrix[0:count]
+            stride = 1
+            blank = [0]
+        else:
+            # Three framebuffer bytes per pixel
+            pixels = self._framebuffer
+            stride = 3
+            blank = bytes(3)
+        size = count * stride
+        width = self.columns * stride
+        if x:
+            shifted = pixels[0:0]
+            for start in range(0, size, width):
+                row = pixels[start : start + width]
+                if x > 0:
+                    shifted += (row[-stride:] if rotate else blank) + row[:-stride]
+                else:
+                    shifted += row[stride:] + (row[:stride] if rotate else blank)
+            pixels = shifted
+        if y > 0:
+            pixels = (pixels[-width:] if rotate else blank * self.columns) + pixels[:-width]
+        elif y < 0:
+            pixels = pixels[width:] + (pixels[:width] if rotate else blank * self.columns)
+        if self._framebuffer is None:
+            self._matrix[0:count] = pixels
+            self._update()
+        else:
+            self._framebuffer[:] = pixels
+            self._mark_dirty(0, count)
+
     def shift_right(self, rotate: bool = False):
         """
         Shift all pixels right
 
         :param rotate: (Optional) Rotate the shifted pixels to the left side (default=False)
         """
-        for y in range(0, self.rows):
-            last_pixel = self._matrix[(y + 1) * self.columns - 1] if rotate else 0
-            for x in range(self.columns - 1, 0, -1):
-                self._matrix[y * self.columns + x] = self._matrix[y * self.columns + x - 1]
-            self._matrix[y * self.columns] = last_pixel
-        self._update()
+        self._shift(1, 0, rotate)
 
     def shift_left(self, rotate: bool = False):
         """
@@ -125,12 +270,7 @@ class PixelMatrix(AutoWriteable):
 
         :param rotate: (Optional) Rotate the shifted pixels to the right side (default=False)
         """
-        for y in range(0, self.rows):
-            last_pixel = self._matrix[y * self.columns] if rotate else 0
-            for x in range(0, self.columns - 1):
-                self._matrix[y * self.columns + x] = self._matrix[y * self.columns + x + 1]
-            self._matrix[(y + 1) * self.columns - 1] = last_pixel
-        self._update()
+        self._shift(-1, 0, rotate)
 
     def shift_up(self, rotate: bool = False):
         """
@@ -138,12 +278,7 @@ class PixelMatrix(AutoWriteable):
 
         :param rotate: (Optional) Rotate the shifted pixels to bottom (default=False)
         """
-        for x in range(0, self.columns):
-            last_pixel = self._matrix[(self.rows - 1) * self.columns + x] if rotate else 0
-            for y in range(self.rows - 1, 0, -1):
-                self._matrix[y * self.columns + x] = self._matrix[(y - 1) * self.columns + x]
-            self._matrix[x] = last_pixel
-        self._update()
+        self._shift(0, 1, rotate)
 
     def shift_down(self, rotate: bool = False):
         """
@@ -151,12 +286,7 @@ class PixelMatrix(AutoWriteable):
 
         :param rotate: (Optional) Rotate the shifted pixels to top (default=False)
         """
-        for x in range(0, self.columns):
-            last_pixel = self._matrix[x] if rotate else 0
-            for y in range(0, self.rows - 1):
-                self._matrix[y * self.columns + x] = self._matrix[(y + 1) * self.columns + x]
-            self._matrix[(self.rows - 1) * self.columns + x] = last_pixel
-        self._update()
+        self._shift(0, -1, rotate)
 
     @property
     def brightness(self):
@@ -168,4 +298,7 @@ class PixelMatrix(AutoWriteable):
     @brightness.setter
     def brightness(self, brightness: float):
         self._matrix.brightness = min(max(brightness, 0.0), 1.0)
+        if self._framebuffer is not None:
+            # Nothing to copy, but the next frame has to be shown
+            self._mark_dirty(0, 0)
         self._update()
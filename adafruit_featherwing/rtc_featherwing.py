@@ -20,14 +20,37 @@ from collections import namedtuple
 
 import adafruit_ds3231
 import board
+from micropython import const
 
 try:
-    from typing import Dict, Optional
+    from typing import Dict, List, Optional, Union
 
     from busio import I2C
 except ImportError:
     pass
 
+_DS3231_SECONDS = const(0x00)
+# How often the seconds register is read while waiting for the DS3231 to start a second
+_CONFIRM_POLL = 0.01
+
+DateTime = namedtuple("DateTime", "second minute hour day month year weekday")
+
+
+class DateTimeSnapshot:
+    """A date and time that is updated in place by `RTCFeatherWing.now_into`,
+    so reading the time does not create a new object each time."""
+
+    __slots__ = ("second", "minute", "hour", "day", "month", "year", "weekday")
+
+    def __init__(self):
+        self.second = 0
+        self.minute = 0
+        self.hour = 0
+        self.day = 0
+        self.month = 0
+        self.year = 0
+        self.weekday = 0
+
 
 class RTCFeatherWing:
     """Class representing an `DS3231 Precision RTC FeatherWing
@@ -40,6 +63,18 @@ class RTCFeatherWing:
             i2c = board.I2C()
         self._rtc = adafruit_ds3231.DS3231(i2c)
 
+        # Read cache, see cache_interval
+        self._cache_interval = 0
+        self._base = None
+        self._sync_time = 0
+        self._check_time = 0
+        self._locked = False
+        self._drift = None
+        self._register = bytearray((_DS3231_SECONDS,))
+        self._second = bytearray(1)
+
+        self._snapshot = DateTimeSnapshot()
+
     def __setitem__(self, index: str, value: int):
         """
         Allow updates using setitem if that makes it easier
@@ -62,7 +97,7 @@ class RTCFeatherWing:
         else:
             raise ValueError("The specified unit of time is invalid")
 
-        self._rtc.datetime = self._encode(now)
+        self._write(self._encode(now))
 
     def _get_time_value(self, unit: str):
         """
@@ -77,6 +112,95 @@ class RTCFeatherWing:
         """
         Return the current date and time in a nice updatable dictionary
         """
+        if not self._cache_interval:
+            return self._read_now()
+        moment = time.monotonic()
+        if self._base is not None and moment - self._check_time < self._cache_interval:
+            if not self._locked:
+                # The DS3231 did not tick while it was watched, so it is not counting
+                return dict(self._base)
+            now = self._extrapolate(moment)
+            if now is not None:
+                return now
+        return self._sync(moment)
+
+    def _sync(self, moment: float) -> Dict[str, int]:
+        """
+        Read the DS3231, check the cached time against it and update the cache.
+        When the start of the second is not known, wait for the DS3231 to start
+        the next one first.
+        """
+        self._check_time = moment
+        if self._locked:
+            fields = self._read_now()
+            expected = self._extrapolate(moment)
+            if expected is not None and expected["day"] == fields["day"]:
+                self._drift = self._day_seconds(fields) - self._day_seconds(expected)
+                if not self._drift:
+                    # Still in step, so keep the known second boundary
+                    return dict(fields)
+            self._locked = False
+        start = self._find_second_start()
+        fields = self._read_now()
+        if start is None:
+            start = time.monotonic()
+        else:
+            self._locked = True
+        self._base = fields
+        self._sync_time = start
+        return dict(fields)
+
+    def _find_second_start(self) -> Optional[float]:
+        """
+        Poll the seconds register until it changes, which takes at most a second.
+        Returns the ``time.monotonic()`` time the new second started, or None if the
+        DS3231 did not tick.
+        """
+        self._read_second()
+        first = self._second[0]
+        last = time.monotonic()
+        deadline = last + 1 + 2 * _CONFIRM_POLL
+        while last < deadline:
+            time.sleep(_CONFIRM_POLL)
+            self._read_second()
+            now = time.monotonic()
+            if self._second[0] != first:
+                # The second started somewhere between the last two reads
+                return (last + now) / 2
+            last = now
+        return None
+
+    def _read_second(self):
+        """
+        Read the seconds register, one byte instead of the whole date and time
+        """
+        with self._rtc.i2c_device as i2c:
+            i2c.write_then_readinto(self._register, self._second)
+
+    def _extrapolate(self, moment: float) -> Optional[Dict[str, int]]:
+        """
+        Work out the current time from the cached time and the monotonic clock.
+        Returns None when the date would change, so it is read from the DS3231.
+        """
+        total = self._day_seconds(self._base) + int(moment - self._sync_time)
+        if total >= 86400:
+            return None
+        now = dict(self._base)
+        now["hour"], total = divmod(total, 3600)
+        now["minute"], now["second"] = divmod(total, 60)
+        return now
+
+    @staticmethod
+    def _day_seconds(date: Dict[str, int]) -> int:
+        """
+        Return the number of seconds since midnight
+        """
+        return date["hour"] * 3600 + date["minute"] * 60 + date["second"]
+
+    def _read_now(self) -> Dict[str, int]:
+        """
+        Read the current date and time from the DS3231
+        """
         now = self._rtc.datetime
         return {
             "second": now.tm_sec,
@@ -88,11 +212,21 @@ class RTCFeatherWing:
             "weekday": now.tm_wday,
         }
 
-    def _encode(self, date: Dict[str, int]) -> Dict[str, int]:
+    def _write(self, datetime: time.struct_time):
+        """
+        Write the date and time to the DS3231 and start the cache over
+        """
+        self._rtc.datetime = datetime
+        self._base = None
+        self._locked = False
+
+    def _encode(self, date: Dict[str, int]) -> time.struct_time:
         """
         Encode the updatable dictionary back into a time struct
         """
-        now = self._rtc.datetime
+        yday = date["day"]
+        for month in range(1, date["month"]):
+            yday += self.get_month_days(month, date["year"])
         return time.struct_time(
             (
                 date["year"],
@@ -102,8 +236,8 @@ class RTCFeatherWing:
                 date["minute"],
                 date["second"],
                 date["weekday"],
-                now.tm_yday,
-                now.tm_isdst,
+                yday,
+                -1,
             )
         )
 
@@ -124,8 +258,12 @@ class RTCFeatherWing:
         :param int month: (Optional) The month to use. If none is provided, current month is used.
         :param int year: (Optional) The year to check. If none is provided, current year is used.
         """
-        if month is None:
-            month = self._get_time_value("month")
+        if month is None or year is None:
+            now = self._get_now()
+            if month is None:
+                month = now["month"]
+            if year is None:
+                year = now["year"]
         leap_year = self.is_leap_year(year)
         max_days = (31, 29 if leap_year else 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
         return max_days[month - 1]
@@ -147,11 +285,7 @@ class RTCFeatherWing:
         if not isinstance(hour, int) or not 0 <= hour < 24:
             raise ValueError("The hour must be an integer in the range of 0-23")
 
-        now = self._get_now()
-        now["hour"] = hour
-        now["minute"] = minute
-        now["second"] = second
-        self._rtc.datetime = self._encode(now)
+        self.update(hour=hour, minute=minute, second=second)
 
     def set_date(self, day: int, month: int, year: int):
         """
@@ -171,11 +305,54 @@ class RTCFeatherWing:
         if not isinstance(day, int) or not 1 <= day <= month_days:
             raise ValueError(f"The day must be an integer in the range of 1-{month_days}")
 
+        self.update(day=day, month=month, year=year)
+
+    def update(self, **units: int):
+        """
+        Change any of the units of time at once with a single read and a single
+        write of the DS3231. The result is checked to be a valid date and time
+        before anything is written.
+
+        :param int units: The units to change, any of ``year``, ``month``, ``day``,
+                          ``hour``, ``minute``, ``second`` and ``weekday``
+
+        This example sets the date and time in one go.
+
+        .. code-block:: python
+
+            from adafruit_featherwing import rtc_featherwing
+
+            rtc = rtc_featherwing.RTCFeatherWing()
+            rtc.update(year=2026, month=10, day=18, hour=12, minute=30, second=0)
+
+        """
         now = self._get_now()
-        now["day"] = day
-        now["month"] = month
-        now["year"] = year
-        self._rtc.datetime = self._encode(now)
+        for unit, value in units.items():
+            if unit not in now:
+                raise ValueError("The specified unit of time is invalid")
+            now[unit] = value
+        self._validate(now)
+        self._write(self._encode(now))
+
+    def _validate(self, date: Dict[str, int]):
+        """
+        Check that every unit of time is in range
+        """
+        for unit, low, high in (
+            ("second", 0, 59),
+            ("minute", 0, 59),
+            ("hour", 0, 23),
+            ("weekday", 0, 6),
+            ("month", 1, 12),
+        ):
+            value = date[unit]
+            if not isinstance(value, int) or not low <= value <= high:
+                raise ValueError(f"The {unit} must be an integer in the range of {low}-{high}")
+        if not isinstance(date["year"], int):
+            raise ValueError("The year must be an integer")
+        month_days = self.get_month_days(date["month"], date["year"])
+        if not isinstance(date["day"], int) or not 1 <= date["day"] <= month_days:
+            raise ValueError(f"The day must be an integer in the range of 1-{month_days}")
 
     @property
     def datetime(self):
@@ -186,7 +363,61 @@ class RTCFeatherWing:
 
     @datetime.setter
     def datetime(self, datetime: time.struct_time):
-        self._rtc.datetime = datetime
+        self._write(datetime)
+
+    @property
+    def cache_interval(self):
+        """
+        How many seconds the date and time may be worked out from ``time.monotonic()``
+        before it is checked against the DS3231 again. Set to 0 to read the DS3231
+        every time (default=0).
+
+        The first read waits for the DS3231 to start a new second, which takes up
+        to a second of reading its seconds register. The cache then knows where
+        seconds start to about a hundredth of a second, however often the time is
+        read, and the properties do not use the I2C bus until the interval has
+        passed or the date changes. The wait is repeated only if the DS3231 no
+        longer agrees with the cache.
+
+        This example reads the DS3231 about once a minute while showing the time.
+
+        .. code-block:: python
+
+            import time
+            from adafruit_featherwing import rtc_featherwing
+
+            rtc = rtc_featherwing.RTCFeatherWing()
+            rtc.cache_interval = 60
+
+            while True:
+                print(f"{rtc.hour:02}:{rtc.minute:02}:{rtc.second:02}")
+                time.sleep(0.1)
+
+        """
+        return self._cache_interval
+
+    @cache_interval.setter
+    def cache_interval(self, interval: float):
+        if interval < 0:
+            raise ValueError("The cache interval must not be negative")
+        self._cache_interval = interval
+        self._base = None
+        self._locked = False
+
+    @property
+    def drift(self):
+        """
+        The difference in seconds between the DS3231 and the cached time the last
+        time they were compared, or None if they have not been compared yet
+        """
+        return self._drift
+
+    def refresh(self):
+        """
+        Read the DS3231 now and check the cached time against it
+        """
+        if self._cache_interval:
+            self._sync(time.monotonic())
 
     @property
     def year(self):
@@ -225,11 +456,7 @@ class RTCFeatherWing:
 
     @day.setter
     def day(self, day: int):
-        month_days = self.get_month_days()
-        if isinstance(day, int) and 1 <= day <= month_days:
-            self._set_time_value("day", day)
-        else:
-            raise ValueError(f"The day must be an integer in the range of 1-{month_days}")
+        self.update(day=day)
 
     @property
     def hour(self):
@@ -292,8 +519,83 @@ class RTCFeatherWing:
         """
         The Current Date and Time in Named Tuple Style (Read Only)
         """
-        date_time = namedtuple("DateTime", "second minute hour day month year weekday")
-        return date_time(**self._get_now())
+        now = self._get_now()
+        return DateTime(
+            now["second"],
+            now["minute"],
+            now["hour"],
+            now["day"],
+            now["month"],
+            now["year"],
+            now["weekday"],
+        )
+
+    @property
+    def snapshot(self):
+        """
+        The Current Date and Time in a DateTimeSnapshot that is reused and updated
+        in place on every read (Read Only)
+
+        This example prints the time once a second without creating new objects.
+
+        .. code-block:: python
+
+            import time
+            from adafruit_featherwing import rtc_featherwing
+
+            rtc = rtc_featherwing.RTCFeatherWing()
+
+            while True:
+                now = rtc.snapshot
+                print(now.hour, now.minute, now.second)
+                time.sleep(1)
+
+        """
+        return self.now_into(self._snapshot)
+
+    def now_into(self, buffer: Union[DateTimeSnapshot, List[int]]):
+        """
+        Write the current date and time into a preallocated object
+
+        :param buffer: A DateTimeSnapshot, or a list of 7 ints that is filled in
+                       the same order as `now`
+        :return: The buffer that was passed in
+        """
+        if self._cache_interval:
+            now = self._get_now()
+            values = (
+                now["second"],
+                now["minute"],
+                now["hour"],
+                now["day"],
+                now["month"],
+                now["year"],
+                now["weekday"],
+            )
+        else:
+            now = self._rtc.datetime
+            values = (
+                now.tm_sec,
+                now.tm_min,
+                now.tm_hour,
+                now.tm_mday,
+                now.tm_mon,
+                now.tm_year,
+                now.tm_wday,
+            )
+        if isinstance(buffer, DateTimeSnapshot):
+            (
+                buffer.second,
+                buffer.minute,
+                buffer.hour,
+                buffer.day,
+                buffer.month,
+                buffer.year,
+                buffer.weekday,
+            ) = values
+        else:
+            buffer[0:7] = values
+        return buffer
 
     @property
     def unixtime(self):
@@ -310,6 +612,6 @@ class RTCFeatherWing:
     def unixtime(self, unixtime: int):
         if isinstance(unixtime, int):
             try:
-                self._rtc.datetime = time.localtime(unixtime)
+                self._write(time.localtime(unixtime))
             except (AttributeError, RuntimeError) as error:
                 print("Error attempting to run time.localtime() on this board\n", error)
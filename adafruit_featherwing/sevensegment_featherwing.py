@@ -17,6 +17,7 @@ __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FeatherWing.git"
 import board
 from adafruit_ht16k33 import segments
 
+from adafruit_featherwing.ht16k33_ram import HT16K33RAM
 from adafruit_featherwing.led_segments import Segments
 
 try:
@@ -39,3 +40,4 @@ class SevenSegmentFeatherWing(Segments):
             i2c = board.I2C()
         self._segments = segments.Seg7x4(i2c, address)
         self._segments.auto_write = False
+        self._ram = HT16K33RAM(i2c, address)
@@ -0,0 +1,140 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_featherwing.simulation`
+====================================================
+
+Runs the FeatherWing helpers on a desktop computer against simulated buses and
+chips, counting every transaction and byte so bus traffic can be measured without
+hardware. The real device drivers are used, so they need to be installed.
+
+`install` must be called before any of the FeatherWing helpers are imported.
+
+.. code-block:: python
+
+    from adafruit_featherwing import simulation
+
+    sim = simulation.install()
+
+    from adafruit_featherwing import joy_featherwing
+
+    wing = joy_featherwing.JoyFeatherWing()
+    sim.reset_stats()
+    print(wing.joystick)
+    print(sim.stats())
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FeatherWing.git"
+
+import sys
+
+from adafruit_featherwing.simulation import buses, devices, modules
+from adafruit_featherwing.simulation.gps import NMEAReplay
+
+try:
+    from typing import Any, Dict, Iterable, Optional
+except ImportError:
+    pass
+
+
+class Simulation:
+    """A set of simulated buses with devices attached
+
+    :param i2c_devices: (Optional) The I2C devices to attach. Defaults to
+                    `devices.default_devices`.
+    :param NMEAReplay gps: (Optional) The source for the UART. Defaults to an
+                           `NMEAReplay` of a fix.
+    """
+
+    def __init__(self, i2c_devices: Optional[Iterable] = None, gps: Optional[NMEAReplay] = None):
+        self.i2c = buses.I2C()
+        """The bus ``board.I2C()`` returns"""
+        self.spi = buses.SPI()
+        """The bus ``board.SPI()`` returns"""
+        self.uart = buses.UART()
+        """The UART ``busio.UART()`` returns"""
+        self.gps = NMEAReplay() if gps is None else gps
+        """The source of the UART data"""
+        self.uart.source = self.gps
+        self.pixels = {}
+        """Counts of NeoPixel and DotStar writes, by pin name"""
+        if i2c_devices is None:
+            i2c_devices = devices.default_devices()
+        for device in i2c_devices:
+            self.i2c.attach(device)
+        self.modules = modules.build(self.i2c, self.spi, self.uart, self.pixels)
+        """The stand-in modules by name"""
+
+    def device(self, address: int):
+        """The simulated I2C device at an address
+
+        :param int address: The address of the device
+        """
+        return self.i2c.device(address)
+
+    def stats(self) -> Dict[str, Any]:
+        """The counts for every bus, I2C device and pixel strip, ready to be written
+        out as JSON"""
+        return {
+            "i2c": self.i2c.stats.as_dict(),
+            "i2c_devices": {
+                f"0x{address:02x}": self.i2c.device(address).stats.as_dict()
+                for address in self.i2c.scan()
+            },
+            "spi": self.spi.stats.as_dict(),
+            "uart": self.uart.stats.as_dict(),
+            "pixels": {name: stats.as_dict() for name, stats in self.pixels.items()},
+        }
+
+    def reset_stats(self):
+        """Set every count back to zero"""
+        self.i2c.stats.reset()
+        for address in self.i2c.scan():
+            self.i2c.device(address).stats.reset()
+        self.spi.stats.reset()
+        self.uart.stats.reset()
+        for stats in self.pixels.values():
+            stats.reset()
+
+
+_replaced = {}
+
+
+def install(simulation: Optional[Simulation] = None) -> Simulation:
+    """Put the stand-in modules of a simulation in place of the CircuitPython core
+    modules. A real ``micropython`` module, such as Blinka's, is kept.
+
+    :param Simulation simulation: (Optional) The simulation to install. Defaults to
+                                  a new `Simulation` with every device.
+    :return: The installed simulation
+    """
+    if simulation is None:
+        simulation = Simulation()
+    for name, module in simulation.modules.items():
+        if name == "micropython":
+            try:
+                import micropython  # noqa: F401
+
+                continue
+            except ImportError:
+                pass
+        if name not in _replaced:
+            _replaced[name] = sys.modules.get(name)
+        sys.modules[name] = module
+    return simulation
+
+
+def uninstall():
+    """Put back the modules `install` replaced. FeatherWing helpers imported while the
+    simulation was installed keep using it."""
+    for name, module in _replaced.items():
+        if module is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = module
+    _replaced.clear()
@@ -0,0 +1,356 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_featherwing.simulation.buses`
+====================================================
+
+In-memory I2C, SPI and UART buses that count every transaction and byte.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FeatherWing.git"
+
+try:
+    from typing import Dict, List, Optional
+except ImportError:
+    pass
+
+
+class BusStats:
+    """Counts of the transactions and bytes moved over a simulated bus or by a
+    simulated device."""
+
+    def __init__(self):
+        self.transactions = 0
+        """The number of transactions"""
+        self.bytes_written = 0
+        """The number of bytes sent to the device"""
+        self.bytes_read = 0
+        """The number of bytes read from the device"""
+
+    def reset(self):
+        """Set all of the counts back to zero"""
+        self.transactions = 0
+        self.bytes_written = 0
+        self.bytes_read = 0
+
+    def add(self, written: int = 0, read: int = 0):
+        """Count one transaction
+
+        :param int written: The number of bytes written in the transaction
+        :param int read: The number of bytes read in the transaction
+        """
+        self.transactions += 1
+        self.bytes_written += written
+        self.bytes_read += read
+
+    @property
+    def bytes_moved(self):
+        """The number of bytes written and read"""
+        return self.bytes_written + self.bytes_read
+
+    def as_dict(self) -> Dict[str, int]:
+        """The counts as a dictionary, ready to be written out as JSON"""
+        return {
+            "transactions": self.transactions,
+            "bytes_written": self.bytes_written,
+            "bytes_read": self.bytes_read,
+        }
+
+    def __repr__(self):
+        return (
+            f"BusStats(transactions={self.transactions}, "
+            f"bytes_written={self.bytes_written}, bytes_read={self.bytes_read})"
+        )
+
+
+class Pin:
+    """A simulated microcontroller pin
+
+    :param str name: The name of the pin on the board
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self):
+        return "board." + self.name
+
+
+def _byte_view(buffer, start: int, end: Optional[int]) -> memoryview:
+    """A byte view of the items from start to end of any buffer, like busio uses"""
+    view = memoryview(buffer)
+    if end is None:
+        end = len(view)
+    stride = view.itemsize
+    if stride != 1:
+        view = view.cast("B")
+    return view[start * stride : end * stride]
+
+
+class I2C:
+    """A simulated I2C bus that passes transactions to the attached devices
+
+    :param ~Pin scl: (Optional) The clock pin
+    :param ~Pin sda: (Optional) The data pin
+    :param int frequency: (Optional) The clock frequency (default=100000)
+    """
+
+    def __init__(
+        self, scl: Optional[Pin] = None, sda: Optional[Pin] = None, *, frequency: int = 100000
+    ):
+        self.frequency = frequency
+        self.stats = BusStats()
+        """Counts for every transaction on the bus"""
+        self._devices = {}
+        self._locked = False
+
+    def attach(self, device, address: Optional[int] = None):
+        """Connect a simulated device to the bus
+
+        :param device: The device, which must have ``i2c_write`` and ``i2c_read`` methods
+        :param int address: (Optional) The address to use instead of ``device.address``
+        :return: The device
+        """
+        if address is None:
+            address = device.address
+        self._devices[address] = device
+        return device
+
+    def detach(self, address: int):
+        """Disconnect the device at an address
+
+        :param int address: The address of the device
+        """
+        self._devices.pop(address, None)
+
+    def device(self, address: int):
+        """The simulated device at an address
+
+        :param int address: The address of the device
+        """
+        try:
+            return self._devices[address]
+        except KeyError:
+            raise OSError(19, "No such device") from None
+
+    def try_lock(self) -> bool:
+        """Lock the bus if it isn't already locked"""
+        if self._locked:
+            return False
+        self._locked = True
+        return True
+
+    def unlock(self):
+        """Release the bus lock"""
+        self._locked = False
+
+    def scan(self) -> List[int]:
+        """The addresses of the attached devices"""
+        return sorted(self._devices)
+
+    def writeto(self, address: int, buffer, *, start: int = 0, end: Optional[int] = None):
+        """Write to the device at an address in one transaction"""
+        device = self.device(address)
+        data = bytes(_byte_view(buffer, start, end))
+        self.stats.add(written=len(data))
+        device.stats.add(written=len(data))
+        device.i2c_write(data)
+
+    def readfrom_into(self, address: int, buffer, *, start: int = 0, end: Optional[int] = None):
+        """Read from the device at an address in one transaction"""
+        device = self.device(address)
+        view = _byte_view(buffer, start, end)
+        view[:] = device.i2c_read(len(view))
+        self.stats.add(read=len(view))
+        device.stats.add(read=len(view))
+
+    def writeto_then_readfrom(
+        self,
+        address: int,
+        out_buffer,
+        in_buffer,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ):
+        """Write then read from the device at an address with a repeated start, which
+        counts as one transaction"""
+        device = self.device(address)
+        data = bytes(_byte_view(out_buffer, out_start, out_end))
+        device.i2c_write(data)
+        view = _byte_view(in_buffer, in_start, in_end)
+        view[:] = device.i2c_read(len(view))
+        self.stats.add(written=len(data), read=len(view))
+        device.stats.add(written=len(data), read=len(view))
+
+    def deinit(self):
+        """Release the bus"""
+        self._locked = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.deinit()
+
+
+class SPI:
+    """A simulated SPI bus. Reads return ``write_value`` bytes.
+
+    :param ~Pin clock: (Optional) The clock pin
+    :param ~Pin MOSI: (Optional) The data out pin
+    :param ~Pin MISO: (Optional) The data in pin
+    """
+
+    def __init__(
+        self,
+        clock: Optional[Pin] = None,
+        MOSI: Optional[Pin] = None,
+        MISO: Optional[Pin] = None,
+    ):
+        self.stats = BusStats()
+        """Counts for every transaction on the bus"""
+        self.frequency = 100000
+        self._locked = False
+
+    def try_lock(self) -> bool:
+        """Lock the bus if it isn't already locked"""
+        if self._locked:
+            return False
+        self._locked = True
+        return True
+
+    def unlock(self):
+        """Release the bus lock"""
+        self._locked = False
+
+    def configure(
+        self, *, baudrate: int = 100000, polarity: int = 0, phase: int = 0, bits: int = 8
+    ):
+        """Set the clock rate and mode"""
+        self.frequency = baudrate
+
+    def write(self, buffer, *, start: int = 0, end: Optional[int] = None):
+        """Write to the bus in one transaction"""
+        self.stats.add(written=len(_byte_view(buffer, start, end)))
+
+    def readinto(self, buffer, *, start: int = 0, end: Optional[int] = None, write_value: int = 0):
+        """Read from the bus in one transaction"""
+        view = _byte_view(buffer, start, end)
+        for index in range(len(view)):
+            view[index] = write_value
+        self.stats.add(read=len(view))
+
+    def write_readinto(
+        self,
+        out_buffer,
+        in_buffer,
+        *,
+        out_start: int = 0,
+        out_end: Optional[int] = None,
+        in_start: int = 0,
+        in_end: Optional[int] = None,
+    ):
+        """Write and read at the same time in one transaction"""
+        written = len(_byte_view(out_buffer, out_start, out_end))
+        view = _byte_view(in_buffer, in_start, in_end)
+        for index in range(len(view)):
+            view[index] = 0
+        self.stats.add(written=written, read=len(view))
+
+    def deinit(self):
+        """Release the bus"""
+        self._locked = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.deinit()
+
+
+class UART:
+    """A simulated UART that reads from a source such as
+    `adafruit_featherwing.simulation.gps.NMEAReplay`. Each call that moves data
+    counts as one transaction.
+
+    :param ~Pin tx: (Optional) The transmit pin
+    :param ~Pin rx: (Optional) The receive pin
+    :param int baudrate: (Optional) The baudrate (default=9600)
+    :param float timeout: (Optional) The read timeout, which is not simulated (default=1)
+    """
+
+    def __init__(
+        self,
+        tx: Optional[Pin] = None,
+        rx: Optional[Pin] = None,
+        *,
+        baudrate: int = 9600,
+        timeout: float = 1,
+        **kwargs,
+    ):
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.stats = BusStats()
+        """Counts for every read and write"""
+        self.source = None
+        """The object data is read from, with ``read``, ``in_waiting`` and ``receive``"""
+
+    @property
+    def in_waiting(self):
+        """The number of bytes waiting to be read"""
+        if self.source is None:
+            return 0
+        return self.source.in_waiting
+
+    def read(self, nbytes: Optional[int] = None) -> Optional[bytes]:
+        """Read up to nbytes, or everything waiting"""
+        waiting = self.in_waiting
+        if nbytes is None or nbytes > waiting:
+            nbytes = waiting
+        if not nbytes:
+            return None
+        data = self.source.read(nbytes)
+        self.stats.add(read=len(data))
+        return data
+
+    def readinto(self, buffer) -> Optional[int]:
+        """Read into a buffer"""
+        data = self.read(len(buffer))
+        if not data:
+            return None
+        buffer[: len(data)] = data
+        return len(data)
+
+    def readline(self) -> Optional[bytes]:
+        """Read up to and including the next newline"""
+        if self.source is None:
+            return None
+        data = self.source.readline()
+        if data:
+            self.stats.add(read=len(data))
+        return data or None
+
+    def write(self, buffer) -> int:
+        """Write to the UART"""
+        data = bytes(buffer)
+        self.stats.add(written=len(data))
+        if self.source is not None:
+            self.source.receive(data)
+        return len(data)
+
+    def reset_input_buffer(self):
+        """Discard anything waiting to be read"""
+        if self.source is not None:
+            self.source.discard()
+
+    def deinit(self):
+        """Release the UART"""
+        self.source = None
@@ -0,0 +1,406 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_featherwing.simulation.devices`
+====================================================
+
+Register level models of the I2C chips on the FeatherWings, so the real drivers
+can run against a simulated `adafruit_featherwing.simulation.buses.I2C` bus.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FeatherWing.git"
+
+import struct
+import time
+
+from adafruit_featherwing.simulation.buses import BusStats
+
+try:
+    from typing import Optional, Tuple
+except ImportError:
+    pass
+
+
+class RegisterDevice:
+    """A device with 8 bit registers and an address pointer that increments after
+    each byte, which is how most I2C sensors work.
+
+    :param int address: (Optional) The I2C address, if not the chip's default
+    """
+
+    DEFAULT_ADDRESS = 0x00
+
+    def __init__(self, address: Optional[int] = None):
+        self.address = self.DEFAULT_ADDRESS if address is None else address
+        self.stats = BusStats()
+        """Counts for the transactions addressed to this device"""
+        self.registers = bytearray(256)
+        """The register contents"""
+        self._pointer = 0
+
+    def i2c_write(self, data: bytes):
+        """Handle a write transaction: the register address, then any data"""
+        if not data:
+            return
+        self._pointer = data[0]
+        start = self._pointer
+        for value in data[1:]:
+            self.registers[self._pointer] = value
+            self._pointer = (self._pointer + 1) & 0xFF
+        if len(data) > 1:
+            self._written(start, len(data) - 1)
+
+    def i2c_read(self, length: int) -> bytes:
+        """Handle a read transaction from the current register address"""
+        self._reading(self._pointer, length)
+        result = bytearray(length)
+        for index in range(length):
+            result[index] = self.registers[self._pointer]
+            self._pointer = (self._pointer + 1) & 0xFF
+        return bytes(result)
+
+    def _written(self, register: int, length: int):
+        """Called after registers are written"""
+
+    def _reading(self, register: int, length: int):
+        """Called before registers are read, to bring them up to date"""
+
+
+def _bcd(value: int) -> int:
+    return value + 6 * (value // 10)
+
+
+def _from_bcd(value: int) -> int:
+    return value - 6 * (value >> 4)
+
+
+class DS3231(RegisterDevice):
+    """A DS3231 real time clock that keeps time from the host clock
+
+    :param int address: (Optional) The I2C address (default=0x68)
+    """
+
+    DEFAULT_ADDRESS = 0x68
+
+    def __init__(self, address: Optional[int] = None):
+        super().__init__(address)
+        self._base = time.time()
+        self._base_monotonic = time.monotonic()
+        # Temperature of 25C
+        self.registers[0x11] = 25
+
+    def _reading(self, register: int, length: int):
+        if register > 0x06:
+            return
+        now = time.localtime(self._base + time.monotonic() - self._base_monotonic)
+        self.registers[0:7] = bytes(
+            (
+                _bcd(now.tm_sec),
+                _bcd(now.tm_min),
+                _bcd(now.tm_hour),
+                _bcd(now.tm_wday + 1),
+                _bcd(now.tm_mday),
+                _bcd(now.tm_mon),
+                _bcd(now.tm_year - 2000),
+            )
+        )
+
+    def _written(self, register: int, length: int):
+        if register > 0x06:
+            return
+        registers = self.registers
+        self._base = time.mktime(
+            (
+                _from_bcd(registers[6]) + 2000,
+                _from_bcd(registers[5] & 0x1F),
+                _from_bcd(registers[4] & 0x3F),
+                _from_bcd(registers[2] & 0x3F),
+                _from_bcd(registers[1] & 0x7F),
+                _from_bcd(registers[0] & 0x7F),
+                0,
+                0,
+                -1,
+            )
+        )
+        self._base_monotonic = time.monotonic()
+
+
+class INA219:
+    """An INA219 current sensor with a 0.1 ohm shunt measuring a settable load
+
+    :param int address: (Optional) The I2C address (default=0x40)
+    """
+
+    DEFAULT_ADDRESS = 0x40
+
+    def __init__(self, address: Optional[int] = None):
+        self.address = self.DEFAULT_ADDRESS if address is None else address
+        self.stats = BusStats()
+        """Counts for the transactions addressed to this device"""
+        self.bus_voltage = 5.0
+        """The simulated bus voltage in volts"""
+        self.current = 100.0
+        """The simulated current in mA"""
+        self.configuration = 0x399F
+        self.calibration = 0
+        self._pointer = 0
+
+    def i2c_write(self, data: bytes):
+        """Handle a write transaction: the register address, then any 16 bit value"""
+        if not data:
+            return
+        self._pointer = data[0]
+        if len(data) >= 3:
+            value = data[1] << 8 | data[2]
+            if self._pointer == 0x00:
+                self.configuration = 0x399F if value & 0x8000 else value
+            elif self._pointer == 0x05:
+                self.calibration = value
+
+    def i2c_read(self, length: int) -> bytes:
+        """Handle a read transaction of the current register"""
+        shunt = round(self.current / 1000 * 0.1 / 0.00001)
+        bus = round(self.bus_voltage / 0.004)
+        current = shunt * self.calibration // 4096
+        values = {
+            0x00: self.configuration,
+            0x01: shunt & 0xFFFF,
+            # Conversion ready is always set
+            0x02: (bus << 3 | 0x02) & 0xFFFF,
+            0x03: (current * bus // 5000) & 0xFFFF,
+            0x04: current & 0xFFFF,
+            0x05: self.calibration,
+        }
+        value = struct.pack(">H", values.get(self._pointer, 0))
+        return (value * (length // 2 + 1))[:length]
+
+
+class ADXL343(RegisterDevice):
+    """An ADXL343 accelerometer with a settable reading, FIFO and interrupt sources
+
+    :param int address: (Optional) The I2C address (default=0x53)
+    """
+
+    DEFAULT_ADDRESS = 0x53
+
+    def __init__(self, address: Optional[int] = None):
+        super().__init__(address)
+        self.registers[0x00] = 0xE5
+        self.raw = (0, 0, 250)
+        """The raw x, y, z reading when the FIFO is empty"""
+        self.fifo = []
+        """Raw x, y, z samples waiting in the FIFO"""
+        self.interrupt_source = 0
+        """The latched interrupt source bits"""
+
+    def trigger(self, bits: int):
+        """Latch interrupt source bits, such as 0x40 for a single tap"""
+        self.interrupt_source |= bits
+
+    def _reading(self, register: int, length: int):
+        if register == 0x30:
+            # Data ready and watermark always follow the data
+            self.registers[0x30] = self.interrupt_source | 0x80
+            if len(self.fifo) >= self.registers[0x38] & 0x1F:
+                self.registers[0x30] |= 0x02
+            self.interrupt_source = 0
+        elif register == 0x32:
+            sample = self.fifo.pop(0) if self.fifo else self.raw
+            self.registers[0x32:0x38] = struct.pack("<hhh", *sample)
+        elif register == 0x39:
+            self.registers[0x39] = min(len(self.fifo), 32)
+
+
+class ADT7410(RegisterDevice):
+    """An ADT7410 temperature sensor with a settable temperature. The limit flags are
+    set as the temperature crosses the limits and cleared when the status is read.
+
+    :param int address: (Optional) The I2C address (default=0x48)
+    """
+
+    DEFAULT_ADDRESS = 0x48
+
+    def __init__(self, address: Optional[int] = None):
+        super().__init__(address)
+        self.registers[0x0B] = 0xCB
+        self.registers[0x04:0x0B] = struct.pack(">hhhB", 64 * 128, 10 * 128, 147 * 128, 5)
+        self.registers[0x00:0x02] = struct.pack(">h", round(21.5 * 128))
+        self._temperature = 21.5
+
+    @property
+    def temperature(self):
+        """The simulated temperature in Celsius"""
+        return self._temperature
+
+    @temperature.setter
+    def temperature(self, value: float):
+        high, low, critical = (
+            limit / 128 for limit in struct.unpack_from(">hhh", self.registers, 0x04)
+        )
+        old = self._temperature
+        status = self.registers[0x02]
+        if (old <= high) != (value <= high):
+            status |= 0x20
+        if (old >= low) != (value >= low):
+            status |= 0x10
+        if (old <= critical) != (value <= critical):
+            status |= 0x40
+        self.registers[0x02] = status
+        self.registers[0x00:0x02] = struct.pack(">h", round(value * 128))
+        self._temperature = value
+
+    def i2c_read(self, length: int) -> bytes:
+        """Handle a read transaction, clearing the limit flags if the status is read"""
+        start = self._pointer
+        result = super().i2c_read(length)
+        if start <= 0x02 < start + length:
+            self.registers[0x02] = 0
+        return result
+
+
+class HT16K33:
+    """An HT16K33 LED driver that keeps its display RAM and settings
+
+    :param int address: (Optional) The I2C address (default=0x70)
+    """
+
+    DEFAULT_ADDRESS = 0x70
+
+    def __init__(self, address: Optional[int] = None):
+        self.address = self.DEFAULT_ADDRESS if address is None else address
+        self.stats = BusStats()
+        """Counts for the transactions addressed to this device"""
+        self.ram = bytearray(16)
+        """The display RAM"""
+        self.oscillator = False
+        self.display_on = False
+        self.blink_rate = 0
+        self.brightness = 15
+        self._pointer = 0
+
+    def i2c_write(self, data: bytes):
+        """Handle a command, or a RAM address followed by display data"""
+        if not data:
+            return
+        command = data[0]
+        if command & 0xF0 == 0x20:
+            self.oscillator = bool(command & 0x01)
+        elif command & 0xF0 == 0x80:
+            self.display_on = bool(command & 0x01)
+            self.blink_rate = (command >> 1) & 0x03
+        elif command & 0xF0 == 0xE0:
+            self.brightness = command & 0x0F
+        else:
+            self._pointer = command & 0x0F
+            payload = data[1 : 17 - self._pointer]
+            self.ram[self._pointer : self._pointer + len(payload)] = payload
+
+    def i2c_read(self, length: int) -> bytes:
+        """Handle a read of the display RAM"""
+        return bytes(self.ram[self._pointer : self._pointer + length]).ljust(length, b"\0")
+
+
+class Seesaw:
+    """A seesaw running the GPIO, ADC and timer modules, as on the Joy and Mini TFT
+    FeatherWings. Unused input pins read high as if pulled up.
+
+    :param int address: (Optional) The I2C address (default=0x49)
+    :param int product_id: (Optional) The product ID reported in the version (default=3632)
+    """
+
+    DEFAULT_ADDRESS = 0x49
+
+    def __init__(self, address: Optional[int] = None, product_id: int = 3632):
+        self.address = self.DEFAULT_ADDRESS if address is None else address
+        self.stats = BusStats()
+        """Counts for the transactions addressed to this device"""
+        self.product_id = product_id
+        self.pins = 0xFFFFFFFF
+        """The level of each GPIO pin as a bitmask"""
+        self.analog = [512] * 8
+        """The value of each ADC channel"""
+        self.interrupt_pins = 0
+        self.interrupt_flags = 0
+        self.pwm = {}
+        """The last duty cycle written to each PWM pin"""
+        self._reply = b""
+
+    def press(self, pins: int):
+        """Pull pins low as if their buttons were pressed"""
+        self._set_pins(self.pins & ~pins)
+
+    def release(self, pins: int):
+        """Let pins go high as if their buttons were released"""
+        self._set_pins(self.pins | pins)
+
+    def _set_pins(self, pins: int):
+        self.interrupt_flags |= (self.pins ^ pins) & self.interrupt_pins
+        self.pins = pins
+
+    @property
+    def interrupt(self):
+        """Whether the interrupt line would be asserted"""
+        return bool(self.interrupt_flags)
+
+    def i2c_write(self, data: bytes):
+        """Handle a module base and function, then any data"""
+        if len(data) < 2:
+            return
+        base, function, payload = data[0], data[1], data[2:]
+        value = struct.unpack(">I", payload[:4])[0] if len(payload) >= 4 else 0
+        self._reply = b""
+        if base == 0x00:  # Status
+            if function == 0x01:
+                self._reply = b"\x55"
+            elif function == 0x02:
+                self._reply = struct.pack(">I", self.product_id << 16 | 0x1234)
+            elif function == 0x03:
+                self._reply = struct.pack(">I", 1 << 0x01 | 1 << 0x08 | 1 << 0x09)
+            elif function == 0x7F:
+                self.interrupt_pins = 0
+                self.interrupt_flags = 0
+        elif base == 0x01:  # GPIO
+            if function == 0x04:
+                self._reply = struct.pack(">II", self.pins, 0)
+            elif function == 0x05:
+                self._set_pins(self.pins | value)
+            elif function == 0x06:
+                self._set_pins(self.pins & ~value)
+            elif function == 0x07:
+                self._set_pins(self.pins ^ value)
+            elif function == 0x08:
+                self.interrupt_pins |= value
+            elif function == 0x09:
+                self.interrupt_pins &= ~value
+            elif function == 0x0A:
+                self._reply = struct.pack(">I", self.interrupt_flags)
+                self.interrupt_flags = 0
+        elif base == 0x08 and function == 0x01 and len(payload) >= 3:  # Timer PWM
+            self.pwm[payload[0]] = payload[1] << 8 | payload[2]
+        elif base == 0x09 and function >= 0x07:  # ADC
+            self._reply = struct.pack(">H", self.analog[(function - 0x07) % len(self.analog)])
+
+    def i2c_read(self, length: int) -> bytes:
+        """Handle a read of the reply to the last request"""
+        return self._reply[:length].ljust(length, b"\0")
+
+
+def default_devices() -> Tuple:
+    """One of each simulated device at its FeatherWing's default address: the Joy
+    FeatherWing seesaw at 0x49, the Mini TFT seesaw at 0x5E, the HT16K33 at 0x70, the
+    DS3231 at 0x68, the INA219 at 0x40, the ADXL343 at 0x53 and the ADT7410 at 0x48.
+    """
+    return (
+        Seesaw(),
+        Seesaw(0x5E, product_id=3321),
+        HT16K33(),
+        DS3231(),
+        INA219(),
+        ADXL343(),
+        ADT7410(),
+    )
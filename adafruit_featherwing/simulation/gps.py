@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_featherwing.simulation.gps`
+====================================================
+
+Replays NMEA sentences to a simulated `adafruit_featherwing.simulation.buses.UART`
+as a GPS module would, and acknowledges PMTK commands.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FeatherWing.git"
+
+import time
+
+try:
+    from typing import Iterable, Optional
+except ImportError:
+    pass
+
+# A fix in New York City on 2024-06-01
+FIX_SENTENCES = (
+    "GPGGA,123519.000,4042.7680,N,07400.3600,W,1,08,0.9,10.0,M,-34.2,M,,",
+    "GPRMC,123519.000,A,4042.7680,N,07400.3600,W,0.50,84.40,010624,,,A",
+)
+
+
+def sentence(body: str) -> bytes:
+    """Wrap the body of an NMEA sentence with ``$``, its checksum and CR LF
+
+    :param str body: The sentence without the ``$`` or checksum
+    """
+    checksum = 0
+    for char in body:
+        checksum ^= ord(char)
+    return f"${body}*{checksum:02X}\r\n".encode()
+
+
+class NMEAReplay:
+    """Replays a set of sentences once per ``interval``, like a GPS sending its
+    update every second.
+
+    :param sentences: (Optional) The sentence bodies to send each update, without the
+                      ``$`` or checksum. Defaults to a GGA and RMC fix.
+    :param float interval: (Optional) The seconds between updates. With 0 the next
+                           update is ready as soon as the last is read (default=1)
+    """
+
+    def __init__(self, sentences: Optional[Iterable[str]] = None, interval: float = 1.0):
+        if sentences is None:
+            sentences = FIX_SENTENCES
+        self._data = b"".join(sentence(body) for body in sentences)
+        self.interval = interval
+        self.updates = 0
+        """The number of updates sent so far"""
+        self.received = []
+        """Every line written to the GPS"""
+        self._replies = bytearray()
+        self._incoming = bytearray()
+        self._position = len(self._data)
+        self._update_time = None
+
+    def _refill(self):
+        if self._position < len(self._data):
+            return
+        now = time.monotonic()
+        if self._update_time is None or now - self._update_time >= self.interval:
+            self._position = 0
+            self._update_time = now
+            self.updates += 1
+
+    @property
+    def in_waiting(self):
+        """The number of bytes ready to read"""
+        self._refill()
+        return len(self._replies) + len(self._data) - self._position
+
+    def read(self, nbytes: int) -> bytes:
+        """Read up to nbytes"""
+        self._refill()
+        result = bytes(self._replies[:nbytes])
+        del self._replies[:nbytes]
+        if len(result) < nbytes:
+            end = min(len(self._data), self._position + nbytes - len(result))
+            result += self._data[self._position : end]
+            self._position = end
+        return result
+
+    def readline(self) -> bytes:
+        """Read up to and including the next newline"""
+        line = b""
+        while not line.endswith(b"\n") and self.in_waiting:
+            line += self.read(1)
+        return line
+
+    def receive(self, data: bytes):
+        """Take bytes written to the GPS, and queue an acknowledgement for each
+        PMTK command"""
+        self._incoming += data
+        while b"\n" in self._incoming:
+            end = self._incoming.index(b"\n") + 1
+            line = bytes(self._incoming[:end]).strip()
+            del self._incoming[:end]
+            self.received.append(line)
+            if line.startswith(b"$PMTK") and len(line) >= 8:
+                command = line[5:8].decode()
+                self._replies += sentence(f"PMTK001,{command},3")
+
+    def discard(self):
+        """Drop everything waiting to be read"""
+        self._replies = bytearray()
+        self._position = len(self._data)
@@ -0,0 +1,213 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_featherwing.simulation.modules`
+====================================================
+
+Stand-ins for the CircuitPython core modules the FeatherWing helpers and drivers
+import: ``board``, ``busio``, ``digitalio``, ``microcontroller``, ``neopixel_write``,
+``displayio``, ``fourwire``, ``busdisplay``, ``sdcardio`` and ``storage``.
+
+* Author(s): Adafruit Industries
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FeatherWing.git"
+
+from types import ModuleType
+
+from adafruit_featherwing.simulation import buses
+
+try:
+    from typing import Dict, Optional
+except ImportError:
+    pass
+
+_PINS = (
+    "A0 A1 A2 A3 A4 A5 D0 D1 D2 D3 D4 D5 D6 D9 D10 D11 D12 D13 SCL SDA SCK MOSI MISO TX RX NEOPIXEL"
+).split()
+
+
+class DigitalInOut:
+    """A simulated digital pin. Set ``value`` to simulate an input changing.
+
+    :param ~buses.Pin pin: The pin to use
+    """
+
+    def __init__(self, pin: buses.Pin):
+        self.pin = pin
+        self.direction = Direction.INPUT
+        self.pull = None
+        self.drive_mode = DriveMode.PUSH_PULL
+        self.value = False
+
+    def switch_to_input(self, pull: Optional[int] = None):
+        """Make the pin an input, reading high if pulled up"""
+        self.direction = Direction.INPUT
+        self.pull = pull
+        self.value = pull == Pull.UP
+
+    def switch_to_output(self, value: bool = False, drive_mode: int = 0):
+        """Make the pin an output"""
+        self.direction = Direction.OUTPUT
+        self.value = value
+
+    def deinit(self):
+        """Release the pin"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.deinit()
+
+
+class Direction:
+    """Pin directions"""
+
+    INPUT = 0
+    OUTPUT = 1
+
+
+class Pull:
+    """Pin pulls"""
+
+    UP = 1
+    DOWN = 2
+
+
+class DriveMode:
+    """Pin drive modes"""
+
+    PUSH_PULL = 0
+    OPEN_DRAIN = 1
+
+
+class FourWire:
+    """A simulated display bus that sends commands and data over a simulated SPI bus"""
+
+    def __init__(self, spi_bus: buses.SPI, *, command=None, chip_select=None, **kwargs):
+        self.spi = spi_bus
+
+    def send(self, command: int, data: bytes, *, toggle_every_byte: bool = False):
+        """Send a command and its data in one transaction"""
+        self.spi.write(bytes((command,)) + bytes(data))
+
+    def reset(self):
+        """Reset the display"""
+
+
+class BusDisplay:
+    """A simulated display that sends its init sequence over a display bus"""
+
+    def __init__(self, display_bus: FourWire, init_sequence: bytes, **kwargs):
+        self.bus = display_bus
+        self.width = kwargs.get("width", 0)
+        self.height = kwargs.get("height", 0)
+        self.rotation = kwargs.get("rotation", 0)
+        self.brightness = 1.0
+        self.root_group = None
+        index = 0
+        while index < len(init_sequence):
+            command = init_sequence[index]
+            length = init_sequence[index + 1]
+            delay = length & 0x80
+            length &= 0x7F
+            display_bus.send(command, init_sequence[index + 2 : index + 2 + length])
+            index += 2 + length + (1 if delay else 0)
+
+    def refresh(self, **kwargs) -> bool:
+        """Pretend to refresh the display"""
+        return True
+
+
+class SDCard:
+    """A missing SD card, so mounting fails as it would with no card inserted"""
+
+    def __init__(self, spi: buses.SPI, cs: buses.Pin, **kwargs):
+        raise OSError(19, "No SD card")
+
+
+def _module(name: str, **attributes) -> ModuleType:
+    module = ModuleType(name)
+    for key, value in attributes.items():
+        setattr(module, key, value)
+    return module
+
+
+def _const(value: int) -> int:
+    return value
+
+
+def _native(function):
+    return function
+
+
+def build(
+    i2c: buses.I2C, spi: buses.SPI, uart: buses.UART, pixel_stats: Dict[str, buses.BusStats]
+) -> Dict[str, ModuleType]:
+    """Build the stand-in modules around a set of simulated buses
+
+    :param I2C i2c: The bus ``board.I2C()`` returns
+    :param SPI spi: The bus ``board.SPI()`` returns
+    :param UART uart: The UART ``busio.UART()`` and ``board.UART()`` return
+    :param dict pixel_stats: Where to count NeoPixel and DotStar writes, by pin name
+    :return: The modules by name
+    """
+    pins = {name: buses.Pin(name) for name in _PINS}
+
+    def make_uart(tx=None, rx=None, **kwargs):
+        uart.baudrate = kwargs.get("baudrate", 9600)
+        uart.timeout = kwargs.get("timeout", 1)
+        return uart
+
+    def make_spi(clock=None, MOSI=None, MISO=None):
+        # DotStars get their own bus so their traffic is counted apart
+        if clock is None or clock is pins["SCK"]:
+            return spi
+        pixel_spi = buses.SPI(clock, MOSI, MISO)
+        pixel_stats[clock.name] = pixel_spi.stats
+        return pixel_spi
+
+    def neopixel_write(pin: DigitalInOut, buffer):
+        name = getattr(pin, "pin", pin).name
+        stats = pixel_stats.setdefault(name, buses.BusStats())
+        stats.add(written=len(buffer))
+
+    def release_displays():
+        pass
+
+    return {
+        "board": _module(
+            "board",
+            I2C=lambda: i2c,
+            STEMMA_I2C=lambda: i2c,
+            SPI=lambda: spi,
+            UART=lambda: uart,
+            board_id="featherwing_simulation",
+            **pins,
+        ),
+        "busio": _module("busio", I2C=lambda *args, **kwargs: i2c, SPI=make_spi, UART=make_uart),
+        "digitalio": _module(
+            "digitalio",
+            DigitalInOut=DigitalInOut,
+            Direction=Direction,
+            Pull=Pull,
+            DriveMode=DriveMode,
+        ),
+        "microcontroller": _module("microcontroller", Pin=buses.Pin),
+        "micropython": _module("micropython", const=_const, native=_native, viper=_native),
+        "neopixel_write": _module("neopixel_write", neopixel_write=neopixel_write),
+        "displayio": _module(
+            "displayio",
+            release_displays=release_displays,
+            FourWire=FourWire,
+            Display=BusDisplay,
+        ),
+        "fourwire": _module("fourwire", FourWire=FourWire),
+        "busdisplay": _module("busdisplay", BusDisplay=BusDisplay),
+        "sdcardio": _module("sdcardio", SDCard=SDCard),
+        "storage": _module("storage", VfsFat=lambda card: None, mount=lambda vfs, path: None),
+    }
@@ -15,15 +15,53 @@ Helper for using the `Adafruit ADXL343 + ADT7410 Sensor FeatherWing
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FeatherWing.git"
 
+import struct
+import time
+from array import array
+from collections import namedtuple
+
 import adafruit_adt7410
 import adafruit_adxl34x
 import board
+import digitalio
+from micropython import const
+
+from adafruit_featherwing.event_queue import EventQueue
 
 try:
-    from typing import Optional
+    from typing import Callable, Optional
+
+    from microcontroller import Pin
 except ImportError:
     pass
 
+_ADXL_INT_SOURCE = const(0x30)
+_ADXL_DATAX0 = const(0x32)
+_ADXL_FIFO_CTL = const(0x38)
+_ADXL_FIFO_STATUS = const(0x39)
+_FIFO_SIZE = const(32)
+_FIFO_BYPASS = const(0b00)
+_FIFO_STREAM = const(0b10)
+_ADT_TEMP = const(0x00)
+_ADT_STATUS = const(0x02)
+_ADT_CRITICAL = const(0x40)
+_ADT_HIGH = const(0x20)
+_ADT_LOW = const(0x10)
+# The ADT7410 converts continuously, so the limit flags change at most this often
+_ADT_CONVERSION_TIME = 0.24
+
+TemperatureAlert = namedtuple("TemperatureAlert", "high low critical")
+
+# Matches the scaling adafruit_adxl34x uses for acceleration
+_ACCELERATION_SCALE = 0.004 * 9.80665
+_INT_SINGLE_TAP = const(0b01000000)
+_INT_DOUBLE_TAP = const(0b00100000)
+_INT_ACT = const(0b00010000)
+_INT_FREE_FALL = const(0b00000100)
+_EVENT_TYPES = ("motion", "tap", "freefall")
+
+MotionEvent = namedtuple("MotionEvent", "event timestamp")
+
 
 class TempMotionFeatherWing:
     """Class helper representing an `Adafruit ADXL343 + ADT7410 Sensor FeatherWing
@@ -41,6 +79,12 @@ class TempMotionFeatherWing:
             i2c = board.I2C()
         self._adxl343 = adafruit_adxl34x.ADXL345(i2c, address=adxl343_address)
         self._adt7410 = adafruit_adt7410.ADT7410(i2c, address=adt7410_address)
+        self._adxl_buffer = bytearray(2)
+        self._callbacks = {}
+        self._irq = None
+        self._events = None
+        # The interrupt source bit of each detection that is enabled, by event type
+        self._event_masks = {}
 
     @property
     def temperature(self):
@@ -74,26 +118,33 @@ class TempMotionFeatherWing:
     def enable_motion_detection(self, **kwargs: int):
         """Enable motion detection"""
         self._adxl343.enable_motion_detection(**kwargs)
+        self._event_masks["motion"] = _INT_ACT
 
     def disable_motion_detection(self):
         """Disable motion detection"""
         self._adxl343.disable_motion_detection()
+        self._event_masks.pop("motion", None)
 
     def enable_freefall_detection(self, **kwargs: int):
         """Enable freefall detection"""
         self._adxl343.enable_freefall_detection(**kwargs)
+        self._event_masks["freefall"] = _INT_FREE_FALL
 
     def disable_freefall_detection(self):
         """Disable freefall detection"""
         self._adxl343.disable_freefall_detection()
+        self._event_masks.pop("freefall", None)
 
     def enable_tap_detection(self, **kwargs: int):
         """Enable freefall detection"""
         self._adxl343.enable_tap_detection(**kwargs)
+        single = kwargs.get("tap_count", 1) == 1
+        self._event_masks["tap"] = _INT_SINGLE_TAP if single else _INT_DOUBLE_TAP
 
     def disable_tap_detection(self):
         """Disable freefall detection"""
         self._adxl343.disable_tap_detection()
+        self._event_masks.pop("tap", None)
 
     @property
     def data_rate(self):
@@ -112,3 +163,383 @@ class TempMotionFeatherWing:
     @range.setter
     def range(self, val: int):
         self._adxl343.range = val
+
+    def add_event_callback(self, event: str, callback: Callable[[MotionEvent], None]):
+        """Call a function with each `MotionEvent` of a type found by `update_events`.
+
+        :param str event: The event type, one of ``"motion"``, ``"tap"`` or ``"freefall"``
+        :param callback: The function to call with the event
+        """
+        if event not in _EVENT_TYPES:
+            raise ValueError("Event must be one of: " + ", ".join(_EVENT_TYPES))
+        self._callbacks.setdefault(event, []).append(callback)
+
+    def remove_event_callback(self, event: str, callback: Callable[[MotionEvent], None]):
+        """Stop calling a function added with `add_event_callback`.
+
+        :param str event: The event type the function was added for
+        :param callback: The function to remove
+        """
+        self._callbacks[event].remove(callback)
+
+    def enable_events(self, irq_pin: Optional[Pin] = None, queue_size: int = 16):
+        """Queue the motion, tap and freefall events enabled with the ``enable_*_detection``
+        methods.
+
+        Each `update_events` reads the interrupt source register once for all of them.
+        Reading it clears the events, so `events` should not be used at the same time.
+
+        :param pin irq_pin: (Optional) The pin the ADXL343 INT1 pad is connected to. If
+                            given, the interrupt source is only read while it is high.
+        :param int queue_size: (Optional) The number of events to hold (default=16)
+
+        This example prints a message for each tap.
+
+        .. code-block:: python
+
+            from adafruit_featherwing import tempmotion_featherwing
+
+            temp_motion = tempmotion_featherwing.TempMotionFeatherWing()
+            temp_motion.enable_tap_detection()
+            temp_motion.enable_events()
+            temp_motion.add_event_callback("tap", lambda event: print("Tap", event.timestamp))
+
+            while True:
+                temp_motion.update_events()
+
+        """
+        events = EventQueue(queue_size)
+        if self._irq is not None:
+            self._irq.deinit()
+            self._irq = None
+        if irq_pin is not None:
+            self._irq = digitalio.DigitalInOut(irq_pin)
+            self._irq.switch_to_input()
+        self._events = events
+
+    def disable_events(self):
+        """Stop queueing motion, tap and freefall events."""
+        if self._irq is not None:
+            self._irq.deinit()
+            self._irq = None
+        self._events = None
+
+    def update_events(self) -> int:
+        """Read the interrupt source register once, then queue an event and call the
+        callbacks for each enabled event type it flags.
+
+        :return: The number of events found
+        :rtype: int
+        """
+        if self._events is None:
+            raise RuntimeError("Events have not been enabled")
+        # INT1 is active high
+        if self._irq is not None and not self._irq.value:
+            return 0
+        if not self._event_masks:
+            return 0
+        source = self._adxl_read(_ADXL_INT_SOURCE)
+        now = time.monotonic()
+        found = 0
+        for event, mask in self._event_masks.items():
+            if not source & mask:
+                continue
+            found += 1
+            motion_event = MotionEvent(event, now)
+            self._events.put(motion_event)
+            for callback in self._callbacks.get(event, ()):
+                callback(motion_event)
+        return found
+
+    def get_event(self) -> Optional[MotionEvent]:
+        """Remove and return the oldest queued event.
+
+        :return: A MotionEvent of the event type and the ``time.monotonic()`` time, or
+                 None if the queue is empty
+        """
+        if self._events is None:
+            return None
+        return self._events.get()
+
+    @property
+    def dropped_events(self):
+        """The number of events dropped because the queue was full."""
+        if self._events is None:
+            return 0
+        return self._events.dropped
+
+    def _adxl_read(self, register: int) -> int:
+        self._adxl_buffer[0] = register
+        with self._adxl343._i2c as i2c:
+            i2c.write_then_readinto(self._adxl_buffer, self._adxl_buffer, out_end=1, in_start=1)
+        return self._adxl_buffer[1]
+
+    def _adxl_write(self, register: int, value: int):
+        self._adxl_buffer[0] = register
+        self._adxl_buffer[1] = value
+        with self._adxl343._i2c as i2c:
+            i2c.write(self._adxl_buffer)
+
+    def enable_fifo(self, watermark: int = 16):
+        """Put the ADXL343 FIFO in stream mode so it keeps the latest 32 samples
+        between reads.
+
+        :param int watermark: (Optional) The number of samples that sets the watermark
+                              bit in the interrupt source register (default=16)
+
+        This example captures vibration at 800 Hz.
+
+        .. code-block:: python
+
+            from array import array
+            import adafruit_adxl34x
+            from adafruit_featherwing import tempmotion_featherwing
+
+            temp_motion = tempmotion_featherwing.TempMotionFeatherWing()
+            temp_motion.data_rate = adafruit_adxl34x.DataRate.RATE_800_HZ
+            temp_motion.enable_fifo()
+
+            raw = array("h", bytes(192))
+            while True:
+                count = temp_motion.read_fifo_into(raw)
+                print(temp_motion.scale_acceleration(raw, count=count))
+
+        """
+        if not 1 <= watermark <= _FIFO_SIZE - 1:
+            raise ValueError("Watermark must be between 1 and 31")
+        self._adxl_write(_ADXL_FIFO_CTL, _FIFO_STREAM << 6 | watermark)
+
+    def disable_fifo(self):
+        """Bypass the ADXL343 FIFO so only the latest sample is kept"""
+        self._adxl_write(_ADXL_FIFO_CTL, _FIFO_BYPASS << 6)
+
+    @property
+    def fifo_entries(self):
+        """The number of samples waiting in the ADXL343 FIFO"""
+        return self._adxl_read(_ADXL_FIFO_STATUS) & 0x3F
+
+    def read_fifo_into(self, buffer: array) -> int:
+        """Drain the ADXL343 FIFO into a buffer of raw x, y, z values.
+
+        The FIFO status and every sample are read while holding the I2C bus.
+
+        :param array buffer: An ``array("h")`` to fill with x, y, z values. It should
+                             hold 96 values to take the whole FIFO in one go.
+        :return: The number of samples read
+        :rtype: int
+        """
+        register = self._adxl_buffer
+        view = memoryview(buffer)
+        with self._adxl343._i2c as i2c:
+            register[0] = _ADXL_FIFO_STATUS
+            i2c.write_then_readinto(register, register, out_end=1, in_start=1)
+            count = min(register[1] & 0x3F, len(buffer) // 3)
+            register[0] = _ADXL_DATAX0
+            # Each 6 byte read of the data registers pops one sample off the FIFO
+            for index in range(0, count * 3, 3):
+                i2c.write_then_readinto(register, view[index : index + 3], out_end=1)
+        return count
+
+    def read_fifo(self) -> array:
+        """Drain the ADXL343 FIFO.
+
+        :return: The raw x, y, z values of each sample
+        :rtype: array
+        """
+        buffer = array("h", bytes(_FIFO_SIZE * 6))
+        count = self.read_fifo_into(buffer)
+        return buffer[: count * 3]
+
+    @staticmethod
+    def scale_acceleration(
+        raw: array, out: Optional[array] = None, count: Optional[int] = None
+    ) -> array:
+        """Convert raw x, y, z values from `read_fifo` or `read_fifo_into` to
+        :math:`m / s ^ 2`.
+
+        :param array raw: The raw values
+        :param array out: (Optional) An ``array("f")`` to write the scaled values into
+        :param int count: (Optional) The number of samples to convert. Defaults to all of them.
+        :return: The scaled values
+        :rtype: array
+        """
+        if count is None:
+            count = len(raw) // 3
+        if out is None:
+            out = array("f", bytes(count * 12))
+        scale = _ACCELERATION_SCALE
+        for index in range(count * 3):
+            out[index] = raw[index] * scale
+        return out
+
+
+class TemperatureMonitor:
+    """Watch the ADT7410 temperature using its high, low and critical limits, so the
+    temperature is only read when it crosses one of them or a slow background sample
+    is due.
+
+    The ADT7410 is put in interrupt mode, where a limit flag is set each time the
+    temperature crosses that limit in either direction and is cleared by reading the
+    status register. If the INT and CT pads are wired to the Feather, the status
+    register is only read when one of them is active, so nothing is read between
+    crossings and background samples. Without them, the status register is read at
+    most once per ADT7410 conversion, every 240 ms, which still polls the I2C bus.
+
+    :param TempMotionFeatherWing wing: The FeatherWing to monitor
+    :param int low: (Optional) The low limit in Celsius (default=10)
+    :param int high: (Optional) The high limit in Celsius (default=64)
+    :param int critical: (Optional) The critical limit in Celsius (default=147)
+    :param float interval: (Optional) The time in seconds between background samples,
+                           or ``None`` to only read the temperature on crossings
+                           (default=60)
+    :param float alpha: (Optional) The weight of each new reading in `average` (default=0.2)
+    :param int window: (Optional) The number of readings `minimum` and `maximum`
+                       cover (default=16)
+    :param pin int_pin: (Optional) The pin the INT pad is connected to
+    :param pin ct_pin: (Optional) The pin the CT pad is connected to
+
+    This example prints the temperature whenever it crosses 20C or 25C, with the INT
+    and CT pads wired to D5 and D6.
+
+    .. code-block:: python
+
+        import board
+        from adafruit_featherwing import tempmotion_featherwing
+
+        temp_motion = tempmotion_featherwing.TempMotionFeatherWing()
+        monitor = tempmotion_featherwing.TemperatureMonitor(
+            temp_motion, low=20, high=25, int_pin=board.D5, ct_pin=board.D6
+        )
+
+        while True:
+            if monitor.check():
+                print(monitor.alert, monitor.temperature, monitor.average)
+
+    """
+
+    def __init__(
+        self,
+        wing: TempMotionFeatherWing,
+        low: int = 10,
+        high: int = 64,
+        critical: int = 147,
+        interval: Optional[float] = 60,
+        alpha: float = 0.2,
+        window: int = 16,
+        int_pin: Optional[Pin] = None,
+        ct_pin: Optional[Pin] = None,
+    ):
+        self._adt7410 = wing._adt7410
+        self._adt7410.low_temperature = low
+        self._adt7410.high_temperature = high
+        self._adt7410.critical_temperature = critical
+        # Whatever mode the part was left in, flag each crossing until the status is read
+        self._adt7410.comparator_mode = adafruit_adt7410.COMP_DISABLED
+        self.interval = interval
+        """The time in seconds between background samples, or ``None``"""
+        self.alpha = alpha
+        """The weight of each new reading in `average`"""
+        self._pins = []
+        for pin in (int_pin, ct_pin):
+            if pin is not None:
+                io = digitalio.DigitalInOut(pin)
+                io.switch_to_input(pull=digitalio.Pull.UP)
+                self._pins.append(io)
+        self._buffer = bytearray(3)
+        self._window = array("f", bytes(4 * window))
+        self._next = 0
+        self._count = 0
+        self._temperature = None
+        self._average = None
+        self._alert = TemperatureAlert(False, False, False)
+        self._last_sample = None
+        self._last_status = None
+
+    def check(self) -> bool:
+        """
+        Read the limit flags if the pins show a crossing, or when no pins are used and
+        a new conversion has finished since they were last read. Read the temperature
+        if a limit was crossed or a background sample is due.
+
+        :return: Whether a limit was crossed since the last check
+        :rtype: bool
+        """
+        now = time.monotonic()
+        due = self._last_sample is None or (
+            self.interval is not None and now - self._last_sample >= self.interval
+        )
+        crossed = False
+        if self._pins:
+            # INT and CT are active low
+            flagged = not all(pin.value for pin in self._pins)
+        else:
+            flagged = self._last_status is None or now - self._last_status >= _ADT_CONVERSION_TIME
+        if flagged:
+            self._last_status = now
+            status = self._read(_ADT_STATUS, 1)[0]
+            crossed = bool(status & (_ADT_HIGH | _ADT_LOW | _ADT_CRITICAL))
+            if crossed:
+                self._alert = TemperatureAlert(
+                    bool(status & _ADT_HIGH),
+                    bool(status & _ADT_LOW),
+                    bool(status & _ADT_CRITICAL),
+                )
+        if crossed or due:
+            self._add(struct.unpack(">h", self._read(_ADT_TEMP, 2))[0] / 128)
+            self._last_sample = now
+        return crossed
+
+    def _read(self, register: int, length: int) -> memoryview:
+        buffer = self._buffer
+        buffer[0] = register
+        with self._adt7410.i2c_device as i2c:
+            i2c.write_then_readinto(buffer, buffer, out_end=1, in_end=length)
+        return memoryview(buffer)[:length]
+
+    def _add(self, temperature: float):
+        self._temperature = temperature
+        if self._average is None:
+            self._average = temperature
+        else:
+            self._average += self.alpha * (temperature - self._average)
+        self._window[self._next] = temperature
+        self._next = (self._next + 1) % len(self._window)
+        self._count = min(self._count + 1, len(self._window))
+
+    def reset(self):
+        """Clear the readings, average and alert"""
+        self._next = 0
+        self._count = 0
+        self._temperature = None
+        self._average = None
+        self._alert = TemperatureAlert(False, False, False)
+        self._last_sample = None
+
+    @property
+    def alert(self):
+        """Which limits were flagged by the last crossing"""
+        return self._alert
+
+    @property
+    def temperature(self):
+        """The last temperature read in Celsius, or ``None`` before the first reading"""
+        return self._temperature
+
+    @property
+    def average(self):
+        """The exponential moving average of the readings in Celsius"""
+        return self._average
+
+    @property
+    def minimum(self):
+        """The lowest of the last window of readings in Celsius"""
+        if not self._count:
+            return None
+        return min(self._window[index] for index in range(self._count))
+
+    @property
+    def maximum(self):
+        """The highest of the last window of readings in Celsius"""
+        if not self._count:
+            return None
+        return max(self._window[index] for index in range(self._count))
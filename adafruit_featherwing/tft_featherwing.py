@@ -17,30 +17,18 @@ Requires:
 """
 
 import time
+from collections import namedtuple
 
 import board
 import digitalio
 import displayio
 import fourwire
+from micropython import const
 
-try:
-    from adafruit_stmpe610 import Adafruit_STMPE610_SPI
-except ImportError:
-    pass
-try:
-    from adafruit_tsc2007 import TSC2007
-except ImportError:
-    pass
-try:
-    from adafruit_focaltouch import Adafruit_FocalTouch
-except ImportError:
-    pass
-
-import sdcardio
-import storage
+from adafruit_featherwing.event_queue import EventQueue
 
 try:
-    from typing import Optional
+    from typing import Optional, Sequence, Tuple
 
     from busio import I2C, SPI
     from microcontroller import Pin
@@ -48,8 +36,28 @@ except ImportError:
     pass
 
 
+# The STMPE610 may take a while to answer after a cold boot
+_TOUCH_READY_TIMEOUT = 1.8
+_TOUCH_READY_POLL = 0.01
+
+_STMPE_INT_EN = const(0x0A)
+_STMPE_INT_EN_TOUCHDET = const(0x01)
+_STMPE_INT_EN_FIFOTH = const(0x02)
+_STMPE_INT_STA = const(0x0B)
+_STMPE_TSC_CTRL = const(0x40)
+_STMPE_FIFO_SIZE = const(0x4C)
+_STMPE_TSC_DATA = const(0xD7)
+
+TouchEvent = namedtuple("TouchEvent", "kind x y pressure timestamp")
+
+
 class TFTFeatherWing:
-    """Base class for TFT FeatherWings."""
+    """Base class for TFT FeatherWings.
+
+    With ``lazy`` set, the SD card is only mounted on the first use of `sdcard` or
+    `mount_sd` and the touchscreen is only set up on the first use of `touchscreen`,
+    so the display can start drawing sooner.
+    """
 
     def __init__(
         self,
@@ -61,7 +69,12 @@ class TFTFeatherWing:
         sd_cs_pin: Optional[Pin] = None,
         irq_pin: Optional[Pin] = None,
         resistive: Optional[bool] = True,
+        lazy: bool = False,
     ):
+        self.startup_times = {}
+        """The time in ms each part of the startup took, by name"""
+        start = time.monotonic_ns()
+
         # Initialize Display Bus
         displayio.release_displays()
         if spi is None:
@@ -72,40 +85,305 @@ class TFTFeatherWing:
             dc_pin = board.D10
 
         self._display_bus = fourwire.FourWire(spi, command=dc_pin, chip_select=cs_pin)
+        self._record_startup("display_bus", start)
 
-        # Initialize SD Card
         if sd_cs_pin is None:
             sd_cs_pin = board.D5
+        if ts_cs_pin is None:
+            ts_cs_pin = board.D6
+        if irq_pin is None:
+            irq_pin = board.D6
 
+        self._spi = spi
+        self._i2c = i2c
+        self._sd_cs_pin = sd_cs_pin
+        self._ts_cs_pin = ts_cs_pin
+        self._irq_pin = irq_pin
+        self._resistive = resistive
         self._sdcard = None
+        self._sd_mounted = False
+        self._touchscreen = None
+        self._touchscreen_ready = False
+        self._touch_irq = None
+        self._touch_events = None
+        self._touch_gate = None
+        self._touch_gate_owned = False
+        self._touch_gate_active = False
+        self._touch_matrix = None
+        self._touch_down = False
+        self._touch_x = None
+        self._touch_y = None
+
+        if not lazy:
+            self.mount_sd()
+            self._init_touchscreen()
+
+    def _record_startup(self, name: str, start: int) -> int:
+        now = time.monotonic_ns()
+        self.startup_times[name] = (now - start) / 1000000
+        return now
+
+    def mount_sd(self):
+        """Mount the SD card to /sd if that has not been tried yet.
+
+        :return: The SD card, or None if there isn't one
+        """
+        if self._sd_mounted:
+            return self._sdcard
+        self._sd_mounted = True
+        start = time.monotonic_ns()
+        # Only loaded when an SD card is wanted
+        import sdcardio
+        import storage
+
         try:
-            self._sdcard = sdcardio.SDCard(spi, sd_cs_pin)
+            self._sdcard = sdcardio.SDCard(self._spi, self._sd_cs_pin)
             vfs = storage.VfsFat(self._sdcard)
             storage.mount(vfs, "/sd")
         except OSError as error:
+            self._sdcard = None
             print("No SD card found:", error)
+        self._record_startup("sd", start)
+        return self._sdcard
+
+    @property
+    def sdcard(self):
+        """The SD card mounted to /sd, or None if there isn't one"""
+        return self.mount_sd()
+
+    @property
+    def touchscreen(self):
+        """The touchscreen driver for the FeatherWing's touch controller"""
+        if not self._touchscreen_ready:
+            self._init_touchscreen()
+        return self._touchscreen
 
-        # Initialize Touchscreen
-        self.touchscreen = None
-        if resistive:
-            if i2c is None:  # STMPE610
-                if ts_cs_pin is None:
-                    ts_cs_pin = board.D6
-                ts_cs = digitalio.DigitalInOut(ts_cs_pin)
-                try:
-                    # the screen might not be ready from cold boot
-                    time.sleep(0.8)
-                    self.touchscreen = Adafruit_STMPE610_SPI(spi, ts_cs)
-                except RuntimeError:
-                    # wait and try once more
-                    time.sleep(1.0)
-                    self.touchscreen = Adafruit_STMPE610_SPI(spi, ts_cs)
+    @touchscreen.setter
+    def touchscreen(self, touchscreen):
+        self._touchscreen = touchscreen
+        self._touchscreen_ready = True
+
+    def _init_touchscreen(self):
+        # Only the driver for the controller on this FeatherWing is imported
+        start = time.monotonic_ns()
+        if self._resistive:
+            if self._i2c is None:  # STMPE610
+                ts_cs = digitalio.DigitalInOut(self._ts_cs_pin)
+                self._touchscreen = self._wait_for_stmpe610(ts_cs)
             else:  # TSC2007
-                if irq_pin is None:
-                    irq_pin = board.D6
-                irq = digitalio.DigitalInOut(irq_pin)
-                self.touchscreen = TSC2007(i2c, irq=irq)
+                from adafruit_tsc2007 import TSC2007
+
+                self._touch_irq = digitalio.DigitalInOut(self._irq_pin)
+                self._touchscreen = TSC2007(self._i2c, irq=self._touch_irq)
         else:  # FocalTouch
-            if irq_pin is None:
-                irq_pin = board.D6
-            self.touchscreen = Adafruit_FocalTouch(i2c, irq_pin=irq_pin)
+            from adafruit_focaltouch import Adafruit_FocalTouch
+
+            self._touchscreen = Adafruit_FocalTouch(self._i2c, irq_pin=self._irq_pin)
+        self._touchscreen_ready = True
+        self._record_startup("touchscreen", start)
+
+    def _wait_for_stmpe610(self, ts_cs: digitalio.DigitalInOut):
+        from adafruit_stmpe610 import Adafruit_STMPE610_SPI
+
+        # The driver raises RuntimeError until the chip answers with its version
+        deadline = time.monotonic() + _TOUCH_READY_TIMEOUT
+        while True:
+            try:
+                return Adafruit_STMPE610_SPI(self._spi, ts_cs)
+            except RuntimeError:
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(_TOUCH_READY_POLL)
+
+    @staticmethod
+    def touch_calibration_matrix(
+        raw_points: Sequence[Tuple[int, int]], screen_points: Sequence[Tuple[int, int]]
+    ) -> Tuple[float, float, float, float, float, float]:
+        """Work out the matrix that maps raw touch points to display coordinates from
+        three points that are not in a line.
+
+        :param raw_points: Three raw (x, y) points read from the touchscreen
+        :param screen_points: The three display (x, y) points that were touched
+        :return: The (a, b, c, d, e, f) matrix where the display x is ``a * x + b * y + c``
+                 and the display y is ``d * x + e * y + f``
+        :rtype: tuple
+        """
+        (x_1, y_1), (x_2, y_2), (x_3, y_3) = raw_points[:3]
+        determinant = (x_1 - x_3) * (y_2 - y_3) - (x_2 - x_3) * (y_1 - y_3)
+        if determinant == 0:
+            raise ValueError("Calibration points must not be in a line")
+        matrix = []
+        for axis in (0, 1):
+            s_1, s_2, s_3 = (point[axis] for point in screen_points[:3])
+            a = ((s_1 - s_3) * (y_2 - y_3) - (s_2 - s_3) * (y_1 - y_3)) / determinant
+            b = ((x_1 - x_3) * (s_2 - s_3) - (x_2 - x_3) * (s_1 - s_3)) / determinant
+            matrix.extend((a, b, s_3 - a * x_3 - b * y_3))
+        return tuple(matrix)
+
+    def enable_touch_events(
+        self,
+        irq_pin: Optional[Pin] = None,
+        queue_size: int = 16,
+        calibration: Optional[Tuple[float, float, float, float, float, float]] = None,
+    ):
+        """Queue touch down, move and up events, read from the touch controller only
+        when it signals a touch.
+
+        The TSC2007 and FocalTouch interrupt lines are used by default. The STMPE610
+        interrupt is not connected on the FeatherWing, so without ``irq_pin`` every
+        update reads the STMPE610 FIFO size over the SPI bus shared with the display and
+        SD card. That is plain polling, and only saves reading the points when there are
+        none. Wire the STMPE610 interrupt to a pin and pass it as ``irq_pin`` to leave
+        the bus alone until there is a touch.
+
+        :param pin irq_pin: (Optional) The pin the touch controller interrupt is
+                            connected to, if not the default
+        :param int queue_size: (Optional) The number of events to hold (default=16)
+        :param tuple calibration: (Optional) A matrix from `touch_calibration_matrix`
+                                  to map raw points to display coordinates
+
+        This example prints each touch event.
+
+        .. code-block:: python
+
+            from adafruit_featherwing import tft_featherwing_24
+
+            tft_featherwing = tft_featherwing_24.TFTFeatherWing24()
+            tft_featherwing.enable_touch_events(
+                calibration=(0, 0.083, -29, 0.064, 0, -23)
+            )
+
+            while True:
+                tft_featherwing.update_touch_events()
+                event = tft_featherwing.get_touch_event()
+                while event:
+                    print(event.kind, event.x, event.y)
+                    event = tft_featherwing.get_touch_event()
+
+        """
+        events = EventQueue(queue_size)
+        touchscreen = self.touchscreen
+        self.disable_touch_events()
+        stmpe610 = self._resistive and self._i2c is None
+        if irq_pin is not None:
+            self._touch_gate = digitalio.DigitalInOut(irq_pin)
+            self._touch_gate.switch_to_input()
+            self._touch_gate_owned = True
+        elif self._touch_irq is not None:
+            self._touch_gate = self._touch_irq
+        elif not self._resistive:
+            self._touch_gate = digitalio.DigitalInOut(self._irq_pin)
+            self._touch_gate.switch_to_input()
+            self._touch_gate_owned = True
+        # The STMPE610 interrupt is active high and the others are active low
+        self._touch_gate_active = stmpe610
+        if stmpe610 and self._touch_gate is not None:
+            # Also interrupt for each new point so moves are not missed
+            touchscreen._write_register_byte(
+                _STMPE_INT_EN, _STMPE_INT_EN_TOUCHDET | _STMPE_INT_EN_FIFOTH
+            )
+        self._touch_matrix = calibration
+        self._touch_events = events
+
+    def disable_touch_events(self):
+        """Stop queueing touch events."""
+        if self._touch_gate_owned:
+            self._touch_gate.deinit()
+        self._touch_gate = None
+        self._touch_gate_owned = False
+        self._touch_gate_active = False
+        self._touch_matrix = None
+        self._touch_events = None
+        self._touch_down = False
+        self._touch_x = None
+        self._touch_y = None
+
+    def update_touch_events(self) -> int:
+        """Read the touch controller if it signals a touch, and queue a down, move or up
+        event for each change.
+
+        :return: The number of events added to the queue
+        :rtype: int
+        """
+        if self._touch_events is None:
+            raise RuntimeError("Touch events have not been enabled")
+        gate = self._touch_gate
+        signalled = gate is None or gate.value == self._touch_gate_active
+        now = time.monotonic()
+        if self._resistive and self._i2c is None:
+            # The STMPE610 also signals when the touch ends
+            return self._update_stmpe610(now) if signalled else 0
+        if not signalled:
+            # The interrupt line is released as soon as the touch ends
+            point = None
+        elif self._resistive:
+            point = self._touchscreen.touch
+            if point["pressure"] <= 100:
+                point = None
+            else:
+                point = (point["x"], point["y"], point["pressure"])
+        else:
+            touches = self._touchscreen.touches
+            point = (touches[0]["x"], touches[0]["y"], 0) if touches else None
+        if point is None:
+            return self._touch_up(now)
+        return self._queue_touch("move" if self._touch_down else "down", point, now)
+
+    def _update_stmpe610(self, now: float) -> int:
+        touchscreen = self._touchscreen
+        count = touchscreen._read_register(_STMPE_FIFO_SIZE, 1)[0]
+        if not count:
+            if self._touch_down and not touchscreen._read_register(_STMPE_TSC_CTRL, 1)[0] & 0x80:
+                added = self._touch_up(now)
+                touchscreen._write_register_byte(_STMPE_INT_STA, 0xFF)
+                return added
+            return 0
+        # The data register does not auto increment, so every point comes out in one read
+        data = touchscreen._read_register(_STMPE_TSC_DATA, count * 4)
+        touchscreen._write_register_byte(_STMPE_INT_STA, 0xFF)
+        added = 0
+        for index in range(0, count * 4, 4):
+            x = data[index] << 4 | data[index + 1] >> 4
+            y = (data[index + 1] & 0x0F) << 8 | data[index + 2]
+            kind = "move" if self._touch_down else "down"
+            added += self._queue_touch(kind, (x, y, data[index + 3]), now)
+        return added
+
+    def _touch_up(self, now: float) -> int:
+        if not self._touch_down:
+            return 0
+        self._touch_down = False
+        return self._touch_events.put(TouchEvent("up", self._touch_x, self._touch_y, 0, now))
+
+    def _queue_touch(self, kind: str, point: Tuple[int, int, int], now: float) -> int:
+        x, y, pressure = point
+        matrix = self._touch_matrix
+        if matrix is not None:
+            x, y = (
+                int(matrix[0] * x + matrix[1] * y + matrix[2]),
+                int(matrix[3] * x + matrix[4] * y + matrix[5]),
+            )
+        if kind == "move" and x == self._touch_x and y == self._touch_y:
+            return 0
+        self._touch_down = True
+        self._touch_x = x
+        self._touch_y = y
+        return self._touch_events.put(TouchEvent(kind, x, y, pressure, now))
+
+    def get_touch_event(self) -> Optional[TouchEvent]:
+        """Remove and return the oldest queued touch event.
+
+        :return: A TouchEvent of the kind (``"down"``, ``"move"`` or ``"up"``), the x and
+                 y position, the pressure and the ``time.monotonic()`` time, or None if
+                 the queue is empty
+        """
+        if self._touch_events is None:
+            return None
+        return self._touch_events.get()
+
+    @property
+    def dropped_touch_events(self):
+        """The number of touch events dropped because the queue was full."""
+        if self._touch_events is None:
+            return 0
+        return self._touch_events.dropped
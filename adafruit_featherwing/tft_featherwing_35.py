@@ -20,8 +20,9 @@ Requires:
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_FeatherWing.git"
 
+import time
+
 import board
-from adafruit_hx8357 import HX8357
 
 from adafruit_featherwing.tft_featherwing import TFTFeatherWing
 
@@ -36,7 +37,7 @@ except ImportError:
 
 class TFTFeatherWing35(TFTFeatherWing):
     """Class representing a TFT FeatherWing 3.5 V1
-    Attempts to mount the SD card to /sd.
+    Attempts to mount the SD card to /sd, when first used if ``lazy`` is set.
     """
 
     def __init__(
@@ -46,18 +47,29 @@ class TFTFeatherWing35(TFTFeatherWing):
         dc: Optional[Pin] = None,
         ts_cs: Optional[Pin] = None,
         sd_cs: Optional[Pin] = None,
+        lazy: bool = False,
     ):
         super().__init__(
-            spi, cs_pin=cs, dc_pin=dc, ts_cs_pin=ts_cs, sd_cs_pin=sd_cs, resistive=True
+            spi,
+            cs_pin=cs,
+            dc_pin=dc,
+            ts_cs_pin=ts_cs,
+            sd_cs_pin=sd_cs,
+            resistive=True,
+            lazy=lazy,
         )
+        start = time.monotonic_ns()
+        from adafruit_hx8357 import HX8357
+
         self.display = HX8357(self._display_bus, width=480, height=320)
         """Display object for the FeatherWing's screen."""
+        self._record_startup("display", start)
 
 
 class TFTFeatherWing35V2(TFTFeatherWing):
     """Class representing a `TFT FeatherWing 3.5 V2
     <https://www.adafruit.com/product/3651>`_.
-    Attempts to mount the SD card to /sd.
+    Attempts to mount the SD card to /sd, when first used if ``lazy`` is set.
     """
 
     def __init__(
@@ -67,6 +79,7 @@ class TFTFeatherWing35V2(TFTFeatherWing):
         dc_pin: Optional[Pin] = None,
         sd_cs_pin: Optional[Pin] = None,
         i2c: Optional[I2C] = None,
+        lazy: bool = False,
     ):
         if i2c is None:
             i2c = board.I2C()
@@ -77,6 +90,11 @@ class TFTFeatherWing35V2(TFTFeatherWing):
             sd_cs_pin=sd_cs_pin,
             i2c=i2c,
             resistive=True,
+            lazy=lazy,
         )
+        start = time.monotonic_ns()
+        from adafruit_hx8357 import HX8357
+
         self.display = HX8357(self._display_bus, width=480, height=320)
         """Display object for the FeatherWing's screen."""
+        self._record_startup("display", start)
@@ -0,0 +1,190 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""
+This runs the hot paths of the FeatherWing helpers against simulated buses on a
+desktop computer and writes the results out as JSON, so a change that makes one
+of them slower or chattier shows up when two runs are compared.
+
+Each result has the operations per second and the bus transactions and bytes
+each operation took. Wings whose drivers are not installed are skipped.
+
+Run it with an optional file name to write the results to:
+
+    python featherwing_benchmarks.py results.json
+"""
+
+import json
+import sys
+import time
+
+from adafruit_featherwing import simulation
+
+sim = simulation.install()
+results = {}
+skipped = {}
+
+
+# HELPERS
+# Time an operation and count the bus traffic it makes
+def bench(name, operation, iterations=200):
+    operation()
+    sim.reset_stats()
+    start = time.monotonic_ns()
+    for _ in range(iterations):
+        operation()
+    elapsed = time.monotonic_ns() - start
+    stats = sim.stats()
+    totals = [stats["i2c"], stats["spi"], stats["uart"], *stats["pixels"].values()]
+    transactions = sum(total["transactions"] for total in totals)
+    moved = sum(total["bytes_written"] + total["bytes_read"] for total in totals)
+    results[name] = {
+        "iterations": iterations,
+        "ops_per_second": round(iterations * 1e9 / elapsed, 1) if elapsed else None,
+        "us_per_op": round(elapsed / iterations / 1000, 2),
+        "transactions_per_op": transactions / iterations,
+        "bytes_per_op": moved / iterations,
+    }
+
+
+def set_attribute(target, name, value):
+    return lambda: setattr(target, name, value)
+
+
+def get_attribute(target, name):
+    return lambda: getattr(target, name)
+
+
+def pixelmatrix_benchmarks():
+    from adafruit_featherwing import neopixel_featherwing
+
+    wing = neopixel_featherwing.NeoPixelFeatherWing()
+
+    def draw():
+        for x in range(0, wing.columns):
+            for y in range(0, wing.rows):
+                wing[x, y] = (x * 32, y * 64, 128)
+
+    draw()
+    for mode in ("auto_write", "manual", "buffered"):
+        wing.auto_write = mode == "auto_write"
+        wing.buffered = mode == "buffered"
+        for shift in ("shift_right", "shift_left", "shift_up", "shift_down"):
+            bench(f"PixelMatrix.{shift}[{mode}]", getattr(wing, shift), 100)
+        bench(f"PixelMatrix.fill[{mode}]", lambda: wing.fill((10, 20, 30)), 100)
+        bench(f"PixelMatrix.__setitem__[{mode}]", lambda: wing.__setitem__((3, 2), (1, 2, 3)))
+    wing.buffered = False
+    bench("PixelMatrix.show", wing.show, 100)
+
+    # A buffered frame sends only what changed, so time a frame where every pixel
+    # moved and one where nothing did
+    wing.buffered = True
+    draw()
+
+    def shifted_frame():
+        wing.shift_right(True)
+        wing.show()
+
+    bench("PixelMatrix.show[buffered]", shifted_frame, 100)
+    bench("PixelMatrix.show[buffered,unchanged]", wing.show, 100)
+    wing.buffered = False
+
+
+def matrix_benchmarks():
+    from adafruit_featherwing import matrix_featherwing
+
+    wing = matrix_featherwing.MatrixFeatherWing()
+    wing.fill(False)
+    values = [True, False]
+    toggle = 0
+
+    def pixel():
+        nonlocal toggle
+        toggle ^= 1
+        wing.pixel(5, 3, values[toggle])
+
+    bench("MatrixFeatherWing.pixel", pixel)
+    bench("MatrixFeatherWing.pixel[read]", lambda: wing.pixel(5, 3))
+    for x in range(0, wing.columns, 3):
+        wing.pixel(x, x % wing.rows, True)
+    for shift in ("shift_right", "shift_left", "shift_up", "shift_down"):
+        bench(f"MatrixFeatherWing.{shift}", lambda shift=shift: getattr(wing, shift)(True))
+    bench("MatrixFeatherWing.fill", lambda: wing.fill(not wing[0, 0]))
+
+
+def segments_benchmarks():
+    from adafruit_featherwing import alphanum_featherwing, sevensegment_featherwing
+
+    for wing in (
+        alphanum_featherwing.AlphaNumFeatherWing(),
+        sevensegment_featherwing.SevenSegmentFeatherWing(),
+    ):
+        label = type(wing).__name__
+        count = 0
+
+        def print_counter(wing=wing):
+            nonlocal count
+            count = (count + 1) % 10000
+            wing.print(count)
+
+        bench(f"{label}.print[changing]", print_counter)
+        bench(f"{label}.print[same]", lambda wing=wing: wing.print("1234"))
+        bench(f"{label}.marquee", lambda wing=wing: wing.marquee("HELLO WORLD", 0, False), 20)
+
+
+def joy_benchmarks():
+    from adafruit_featherwing import joy_featherwing
+
+    wing = joy_featherwing.JoyFeatherWing()
+    bench("JoyFeatherWing.button_a", get_attribute(wing, "button_a"), 20)
+    bench("JoyFeatherWing.joystick", get_attribute(wing, "joystick"), 20)
+    bench("JoyFeatherWing.read_state", wing.read_state, 20)
+
+
+def minitft_benchmarks():
+    from adafruit_featherwing import minitft_featherwing
+
+    wing = minitft_featherwing.MiniTFTFeatherWing()
+    bench("MiniTFTFeatherWing.buttons", get_attribute(wing, "buttons"), 20)
+
+
+def rtc_benchmarks():
+    from adafruit_featherwing import rtc_featherwing
+
+    wing = rtc_featherwing.RTCFeatherWing()
+    for name in ("now", "datetime", "hour", "unixtime"):
+        bench(f"RTCFeatherWing.{name}", get_attribute(wing, name))
+    bench("RTCFeatherWing.hour[set]", set_attribute(wing, "hour", 12))
+    bench("RTCFeatherWing.set_time", lambda: wing.set_time(12, 30, 15))
+    bench("RTCFeatherWing.set_date", lambda: wing.set_date(1, 6, 2024))
+
+
+def ina219_benchmarks():
+    from adafruit_featherwing import ina219_featherwing
+
+    wing = ina219_featherwing.INA219FeatherWing()
+    for name in ("bus_voltage", "shunt_voltage", "current"):
+        bench(f"INA219FeatherWing.{name}", get_attribute(wing, name))
+    bench("INA219FeatherWing.read_sample", wing.read_sample)
+
+
+for benchmarks in (
+    pixelmatrix_benchmarks,
+    matrix_benchmarks,
+    segments_benchmarks,
+    joy_benchmarks,
+    minitft_benchmarks,
+    rtc_benchmarks,
+    ina219_benchmarks,
+):
+    try:
+        benchmarks()
+    except ImportError as error:
+        skipped[benchmarks.__name__] = str(error)
+
+report = {"results": results, "skipped": skipped}
+if len(sys.argv) > 1:
+    with open(sys.argv[1], "w") as output:
+        json.dump(report, output, indent=2)
+else:
+    print(json.dumps(report, indent=2))
@@ -0,0 +1,50 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""
+This compares the cost of one shift using the built in shift methods
+against the per-pixel loop PixelMatrix used before, which copied the
+pixels one at a time through the driver
+"""
+
+import time
+
+from adafruit_featherwing import neopixel_featherwing
+
+wing = neopixel_featherwing.NeoPixelFeatherWing()
+wing.auto_write = False
+FRAMES = 50
+
+
+# HELPERS
+# Shift the display right the way PixelMatrix used to, copying each pixel on its
+# own through the driver
+def per_pixel_shift_right():
+    pixels = wing._matrix
+    columns = wing.columns
+    for y in range(0, wing.rows):
+        last_pixel = pixels[(y + 1) * columns - 1]
+        for x in range(columns - 1, 0, -1):
+            pixels[y * columns + x] = pixels[y * columns + x - 1]
+        pixels[y * columns] = last_pixel
+
+
+def time_shift(shift):
+    start = time.monotonic_ns()
+    for _ in range(FRAMES):
+        shift()
+    return (time.monotonic_ns() - start) / FRAMES / 1000
+
+
+# Draw a gradient so there is something to move
+for x in range(0, wing.columns):
+    for y in range(0, wing.rows):
+        wing[x, y] = (x * 32, y * 64, 128)
+wing.show()
+
+per_pixel = time_shift(per_pixel_shift_right)
+bulk = time_shift(lambda: wing.shift_right(True))
+
+print(f"Per pixel shift: {per_pixel:.1f} us")
+print(f"Bulk shift:      {bulk:.1f} us")
+print(f"Speedup:         {per_pixel / bulk:.1f}x")
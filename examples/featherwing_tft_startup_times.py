@@ -0,0 +1,19 @@
+# SPDX-FileCopyrightText: 2026 Adafruit Industries
+# SPDX-License-Identifier: MIT
+
+"""
+This starts a TFT FeatherWing with the SD card and touchscreen set up lazily,
+then prints how long each part of the startup took
+"""
+
+from adafruit_featherwing import tft_featherwing_24
+
+tft_featherwing = tft_featherwing_24.TFTFeatherWing24(lazy=True)
+print("Display ready")
+
+# The touchscreen and SD card are set up on first use
+print("Touchscreen:", tft_featherwing.touchscreen)
+print("SD card:", tft_featherwing.sdcard)
+
+for name, elapsed in tft_featherwing.startup_times.items():
+    print(f"{name}: {elapsed:.1f} ms")